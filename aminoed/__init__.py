@@ -4,46 +4,120 @@ __license__ = 'MIT'
 __copyright__ = 'Copyright 2020-2023 Alert'
 __version__ = '2.8.4.13'
 
-from asyncio import sleep, create_task, gather
-from asyncio.events import AbstractEventLoop
-import signal
-from .helpers.utils import *
+from importlib import import_module
+from typing import TYPE_CHECKING, Dict, Optional
+
+from .helpers.types import Language
+
+if TYPE_CHECKING:
+    from asyncio.events import AbstractEventLoop
+    from aiohttp import BaseConnector, ClientSession
+
+# Nothing below is imported until first used: `import aminoed` creates
+# no event loop, session or model, and installs no signal handler.
+_LAZY: Dict[str, str] = {
+    "sleep": "asyncio",
+    "create_task": "asyncio",
+    "gather": "asyncio",
+    "AbstractEventLoop": "asyncio",
+    "signal": "signal",
+    "BaseConnector": "aiohttp",
+    "ClientSession": "aiohttp",
+    "HttpClient": ".http",
+    "ConnectionPool": ".helpers.pool",
+    "CommandRouter": ".helpers.dispatch",
+    "EventQueue": ".helpers.dispatch",
+    "PageCursor": ".helpers.paginator",
+    "Paginator": ".helpers.paginator",
+    "IdentityMap": ".helpers.identity",
+    "RateLimiter": ".helpers.ratelimit",
+    "TokenBucket": ".helpers.ratelimit",
+    "RetryBudget": ".helpers.retry",
+    "RetryPolicy": ".helpers.retry",
+    "ResponseCache": ".helpers.cache",
+    "SingleFlight": ".helpers.cache",
+    "CredentialStore": ".helpers.store",
+    "LogStore": ".helpers.store",
+    "MemoryStore": ".helpers.store",
+    "SQLiteStore": ".helpers.store",
+    "set_store": ".helpers.store",
+    "Serializer": ".helpers.serializer",
+    "set_serializer": ".helpers.serializer",
+    "CompactMessage": ".helpers.compact",
+    "CompactUserProfile": ".helpers.compact",
+    "compact_messages": ".helpers.compact",
+    "Client": ".client",
+    "SessionManager": ".helpers.session",
+    "AminoWebSocket": ".websocket"
+}
+
+# Star-exported modules, searched from the cheapest to import.
+_MODULES = (".helpers.utils", ".helpers.types", ".helpers.exceptions", ".helpers.models", ".helpers.event")
+
+
+def __getattr__(name: str):
+    if name in _LAZY:
+        value = getattr(import_module(_LAZY[name], __name__), name)
+    
+    elif name == "loop":
+        value = import_module(".helpers.utils", __name__).get_event_loop()
+    
+    elif name == "__all__":
+        # "loop" is listed so star-imports still get it, it's created on first access.
+        value = sorted({*_LAZY, "loop", "RU", "ENG", "set_lang", "set_pool", "run_with_client", "run"} | {
+            key for module in _MODULES for key in vars(import_module(module, __name__)) if not key.startswith("_")})
+    
+    else:
+        for module in _MODULES:
+            if hasattr(module := import_module(module, __name__), name):
+                value = getattr(module, name)
+                break
+        else:
+            raise AttributeError(f"module '{__name__}' has no attribute '{name}'")
+    
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted({*globals(), *__getattr__("__all__")})
 
-loop = get_event_loop()
-
-from aiohttp import BaseConnector, ClientSession
-ClientSession.__del__ = lambda _: None
-BaseConnector.__del__ = lambda _: None
-
-from .http import HttpClient
-
-from .client import Client
-from .websocket import AminoWebSocket
-
-from .helpers.types import *
-from .helpers.models import *
-from .helpers.exceptions import *
-from .helpers.event import *
 
 RU: str = Language.RU
 ENG: str = Language.ENG
 
+
 def set_lang(lang: str = Language.ENG):
+    from .http import HttpClient
     HttpClient.LANGUAGE = lang
 
 
+def set_pool(
+    limit: int = 100,
+    limit_per_host: int = 0,
+    keepalive_timeout: float = 60
+):
+    from .http import HttpClient
+    from .helpers.pool import ConnectionPool
+    HttpClient.pool = ConnectionPool(limit, limit_per_host, keepalive_timeout)
+
+
 def run_with_client(
     check_updates: bool = True,
     ndc_id: Optional[str] = None,
     device_id: Optional[str] = None,
-    loop: Optional[AbstractEventLoop] = loop,
+    loop: Optional['AbstractEventLoop'] = None,
     proxy: Optional[str] = None,
     proxy_auth: Optional[str] = None,
     timeout: Optional[int] = None,
-    connector: Optional[BaseConnector] = None,
-    session: Optional[ClientSession] = None,
+    connector: Optional['BaseConnector'] = None,
+    session: Optional['ClientSession'] = None,
     debug: bool = False
 ) -> None:
+    from .client import Client
+    from .http import install_signal_handlers
+    from .helpers.utils import get_event_loop
+    
     async def start(loop, callback):
         async with Client(
             ndc_id, 
@@ -62,20 +136,18 @@ def run_with_client(
             await callback(client)
 
     def _start(callback):
-        loop.run_until_complete(start(loop, callback))
+        install_signal_handlers()
+        
+        _loop = loop or get_event_loop()
+        _loop.run_until_complete(start(_loop, callback))
     return _start
 
 
 def run():
+    from .http import install_signal_handlers
+    from .helpers.utils import get_event_loop
+    
     def start(callback):
-        loop.run_until_complete(callback())
+        install_signal_handlers()
+        get_event_loop().run_until_complete(callback())
     return start
-
-def _on_close():
-    if HttpClient._session._connector:
-        HttpClient._session._connector._close() 
-
-    json.dump(CACHE, open(".ed.json", "w"))
-
-signal.signal(signal.SIGTERM, _on_close)
-signal.signal(signal.SIGTERM, _on_close)
@@ -2,26 +2,49 @@ import io
 import json
 import sys
 import aiofile
-import requests
 
 from copy import copy
-from typing import Optional, Tuple
+from typing import Any, Callable, Dict, Optional, Tuple
 
 from aiohttp import BaseConnector, ClientSession
 from asyncio import AbstractEventLoop, sleep
 from zipfile import ZIP_DEFLATED, ZipFile
 from eventemitter import EventEmitter
+from pydantic import ValidationError
 
 from . import __version__, __title__
-from .http import HttpClient, WebHttpClient
+from .http import HttpClient, WebHttpClient, install_signal_handlers
 from .helpers.utils import *
 from .helpers.exceptions import NoCommunity
 from .helpers.types import GLOBAL_ID
 from .helpers.models import *
 from .websocket import AminoWebSocket
+from .helpers.session import SessionManager
+from .helpers.updates import schedule_update_check
+
+
+class RootSetting:
+    # Stored on the root client, so community views see later changes.
+    def __set_name__(self, owner: type, name: str) -> None:
+        self.name = "_" + name
+    
+    def __get__(self, client: Optional['Client'], owner: type = None) -> Any:
+        if client is None:
+            return self
+        return getattr(getattr(client, "_root", None) or client, self.name)
+    
+    def __set__(self, client: 'Client', value: Any) -> None:
+        setattr(getattr(client, "_root", None) or client, self.name, value)
 
 
 class Client(HttpClient):
+    raw = RootSetting()
+    lazy = RootSetting()
+    identity_map = RootSetting()
+    rate_limiter = RootSetting()
+    retry_policy = RootSetting()
+    cache = RootSetting()
+    
     def __init__(
         self,
         ndc_id: Optional[str] = None,
@@ -35,22 +58,38 @@ class Client(HttpClient):
         connector: Optional[BaseConnector] = None,
         check_updates: bool = True,
         auth: Optional[Auth] = None, 
-        debug: bool = False
+        debug: bool = False,
+        workers: int = 0,
+        queue_size: int = 1000,
+        backpressure: Optional[str] = None,
+        lanes: int = 0,
+        lane_key: Optional[Callable[[Dict], Any]] = None
     ) -> None:
-        super().__init__(ndc_id, None, proxy, proxy_auth, timeout, connector, debug)
+        super().__init__(ndc_id, session, proxy, proxy_auth, timeout, connector, debug)
         self._loop: Optional[AbstractEventLoop] = loop
-        self._session = session or self._session
         
         self.device_id: str = device_id or self.device_id
         self.emitter: EventEmitter = EventEmitter(self._loop)
         
         self._websocket: Optional[AminoWebSocket] = None
+        # Passed to AminoWebSocket when it's created, see its dispatch modes.
+        self.websocket_options: Dict[str, Any] = dict(
+            workers=workers, queue_size=queue_size, backpressure=backpressure, lanes=lanes, lane_key=lane_key)
         self.callbacks_to_execute: list = []
         self.priority_callbacks_to_execute: list = []
         
         self.prefix = prefix or ""
         self.community_info: Optional[Community] = None
         
+        # Shared with every view returned by community().
+        self._root: Optional[Client] = None
+        self.communities: Dict[int, Community] = {}
+        self._community_links: Dict[str, int] = {}
+        self._community_views: Dict[int, Client] = {}
+        
+        # Re-logins in the background before the sid expires, see keep_session().
+        self.session_manager: Optional[SessionManager] = None
+        
         if check_updates:
             self.check_lib_updates()
             
@@ -63,12 +102,61 @@ class Client(HttpClient):
             self._loop = get_event_loop()
         return self._loop
     
+    @property
+    def auth(self) -> Auth:
+        return HttpClient.auth.fget(self)
+    
+    @auth.setter
+    def auth(self, auth: Auth) -> None:
+        root = getattr(self, "_root", None) or self
+        root._auth = auth
+        
+        for client in getattr(root, "_community_views", {}).values():
+            client._auth = auth
+    
+    @property
+    def ndc_id(self) -> int:
+        return HttpClient.ndc_id.fget(self)
+    
+    @ndc_id.setter
+    def ndc_id(self, ndc_id: int) -> None:
+        # Views are cached per community and shared, they never move.
+        if getattr(self, "_root", None) is not None:
+            raise Exception("A community view can't change its community, use community() instead.")
+        HttpClient.ndc_id.fset(self, ndc_id)
+    
     @property
     def websocket(self):
+        if self._root is not None:
+            return self._root.websocket
+        
         if not self._websocket:
-            self._websocket = AminoWebSocket(self.auth)
+            self._websocket = AminoWebSocket(self.auth, **self.websocket_options)
+            self._websocket.client = self
         return self._websocket
 
+    async def request(self, method: str, path: str, **kwargs):
+        if (manager := (self._root or self).session_manager) is not None:
+            await manager.ensure_fresh()
+        return await super().request(method, path, **kwargs)
+    
+    def keep_session(
+        self, 
+        email: str = None, 
+        password: str = None, 
+        phone_number: str = None,
+        margin: float = 1800
+    ) -> SessionManager:
+        root = self._root or self
+        
+        if root.session_manager is not None:
+            root.session_manager.stop()
+            
+        root.session_manager = SessionManager(root, email, password, phone_number, margin)
+        root.session_manager.start()
+        
+        return root.session_manager
+    
     def set_auth(self, auth: Auth):
         self.auth = auth
         self.websocket.auth = auth
@@ -91,15 +179,12 @@ class Client(HttpClient):
         pass
 
     async def _close_session(self):
-        if not self.session.closed:
-            await self.session.close()
+        # The pooled session is shared by every client, only close our own.
+        if self._session and not self._session.closed:
+            await self._session.close()
             
     def check_lib_updates(self):
-        response = requests.get(f"https://pypi.python.org/pypi/{__title__}/json")
-        __newest__ = response.json().get("info", {}).get("version", __version__)
-        
-        if __version__ != __newest__:
-            print(f"New version available: {__newest__} (Using {__version__})")
+        schedule_update_check(__title__, __version__)
     
     def with_proxy(
         self, func,
@@ -122,7 +207,8 @@ class Client(HttpClient):
             timeout = timeout or self.timeout.total
                         
             ClientClass: 'Client' = getattr(sys.modules[__name__], 'Client')
-            client: 'Client' = ClientClass(ndc_id, device_id, None, proxy, proxy_auth, timeout)
+            client: 'Client' = ClientClass(ndc_id, device_id, None, proxy, proxy_auth, timeout, 
+                                           session=self._session, check_updates=False)
    
             client.auth = self.auth
         
@@ -190,39 +276,55 @@ class Client(HttpClient):
             commands = [f"{prefix}{command}" for command in commands]
             
             for command in commands:
+                command = self.websocket.bot_commands.add(command)
                 self.websocket.emitter.on(command, callback)
-                self.websocket.bot_commands.append(command)
                 
             return callback
 
         return register_handler
     
-    async def set_community(
+    async def resolve_community(
         self, 
         community: Union[str, int, Community] = GLOBAL_ID
-    ) -> 'Client':        
-        if isinstance(community, str):
-            if community.isdigit():
-                self.ndc_id = int(community)
-                
-            else:
-                if "http" not in community and "://" not in community:
-                    community = f"{WebHttpClient.URL}c/{community}"
-            
-                link_info = await self.get_link_info(community)
-                
-                self.ndc_id = link_info.community.ndcId
-                self.community_info = link_info.community
-                
-        elif isinstance(community, Community):
-            self.community_info = community
-            self.ndc_id = community.ndcId
+    ) -> int:
+        # Links and aminoIds are resolved once, later calls are a dict lookup.
+        if isinstance(community, Community):
+            self.communities[community.ndcId] = community
+            return community.ndcId
         
         elif isinstance(community, int):
-            self.ndc_id = community       
-            
-        else:
+            return community
+        
+        elif not isinstance(community, str):
             raise NoCommunity()
+        
+        if community.isdigit():
+            return int(community)
+        
+        if "http" not in community and "://" not in community:
+            community = f"{WebHttpClient.URL}c/{community}"
+        
+        if (ndc_id := self._community_links.get(community)) is None:
+            link_info = await self.get_link_info(community)
+            
+            ndc_id = link_info.community.ndcId
+            self.communities[ndc_id] = link_info.community
+            self._community_links[community] = ndc_id
+        
+        return ndc_id
+    
+    async def set_community(
+        self, 
+        community: Union[str, int, Community] = GLOBAL_ID
+    ) -> 'Client':        
+        # Views never move, a view returns the other community's view.
+        if self._root is not None:
+            return await self.community(community)
+        
+        self.ndc_id = await self.resolve_community(community)
+        
+        if (community_info := self.communities.get(self.ndc_id)) is not None:
+            self.community_info = community_info
 
         return self
     
@@ -230,30 +332,19 @@ class Client(HttpClient):
         self, 
         community: Union[str, int, Community] = GLOBAL_ID
     ) -> 'Client':        
-        client = copy(self)
-        
-        if isinstance(community, str):
-            if community.isdigit():
-                client.ndc_id = int(community)
-                
-            else:
-                if "http" not in community and "://" not in community:
-                    community = f"{WebHttpClient.URL}c/{community}"
-            
-                link_info = await self.get_link_info(community)
-                
-                client.ndc_id = link_info.community.ndcId
-                client.community_info = link_info.community
-                
-        elif isinstance(community, Community):
-            client.community_info = community
-            client.ndc_id = community.ndcId
-        
-        elif isinstance(community, int):
-            client.ndc_id = community       
+        return self.community_view(await self.resolve_community(community))
+    
+    def community_view(self, ndc_id: int) -> 'Client':
+        # Auth, session manager, websocket and the RootSetting attributes
+        # (raw, lazy, identity map, limiter, retry policy, cache) are read
+        # from the root, changes made after the view exists included.
+        if (client := self._community_views.get(ndc_id)) is None:
+            client = copy(self)
+            client._root = self._root or self
+            client._ndc_id = ndc_id
+            client.community_info = self.communities.get(ndc_id)
             
-        else:
-            raise NoCommunity()
+            self._community_views[ndc_id] = client
 
         return client
     
@@ -276,8 +367,11 @@ class Client(HttpClient):
         return self.auth
     
     def start(self, email: str = None, password: str = None, sid: str = None) -> Auth:
+        install_signal_handlers()
+        
         if not sid:
             self.loop.run_until_complete(self.cached_login(email, password))
+            self.keep_session(email, password)
         else:
             self.loop.run_until_complete(self.login_sid(sid))
         
@@ -293,6 +387,25 @@ class Client(HttpClient):
             
         self.loop.run_forever()
     
+    async def _cached_auth(self, email: str) -> Optional[Auth]:
+        # Store errors propagate, only an entry that can't be decoded is
+        # dropped and replaced by a fresh login.
+        if not (auth_json := await get_cache(email, False)):
+            return None
+        
+        try:
+            auth = Auth(**auth_json)
+            expired = sid_expired(auth_json["sid"])
+        except (KeyError, TypeError, ValueError, ValidationError):
+            await drop_cache(email)
+            return None
+        
+        if not expired:
+            await self.login_sid(auth.sid)
+            
+            self.auth = auth
+            return self.auth
+    
     async def cached_login(
         self, 
         email: str, 
@@ -300,24 +413,16 @@ class Client(HttpClient):
         device: str = None,
         is_temp: bool = False
     ) -> Auth:
-        try:
-            if (auth_json := await get_cache(email, False)):
-                auth = Auth(**auth_json)
-                
-                auth_json["sid"]
-                # Calling KeyError if sid not defined
-                            
-                if not sid_expired(auth.sid):
-                    await self.login_sid(auth.sid)
-                    
-                    self.auth = auth
-                    return self.auth
-        except Exception as e:
-            os.remove(".ed.cache")
-            raise Exception(f"{e}\n\nWrong cache! Restart your script.")
+        if (auth := await self._cached_auth(email)) is not None:
+            return auth
+        
+        # One process logs in, the others wait and pick up its sid.
+        async with cache_lock(email):
+            if (auth := await self._cached_auth(email)) is not None:
+                return auth
             
-        auth = await self.login(email, password, device)
-        await set_cache(email, auth.dict(), is_temp)
+            auth = await self.login(email, password, device)
+            await set_cache(email, auth.dict(), is_temp)
         
         return auth
 
@@ -1,4 +1,21 @@
-from .exceptions import *
-from .models import *
-from .types import *
-from .utils import *
+from importlib import import_module
+
+# Loaded on first attribute access, see aminoed/__init__.py.
+_MODULES = ("utils", "types", "exceptions", "models")
+
+
+def __getattr__(name: str):
+    if name in _MODULES:
+        return import_module(f".{name}", __name__)
+
+    if name == "__all__":
+        return sorted({key for module in _MODULES 
+                       for key in vars(import_module(f".{module}", __name__)) if not key.startswith("_")})
+
+    for module in _MODULES:
+        module = import_module(f".{module}", __name__)
+
+        if hasattr(module, name):
+            return getattr(module, name)
+
+    raise AttributeError(f"module '{__name__}' has no attribute '{name}'")
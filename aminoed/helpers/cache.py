@@ -0,0 +1,138 @@
+import asyncio
+import re
+
+from collections import OrderedDict
+from time import monotonic
+from weakref import WeakSet
+from typing import Any, Awaitable, Callable, Dict, Hashable, List, Optional, Pattern, Tuple
+
+from .serializer import clone
+
+
+class SingleFlight:
+    def __init__(self) -> None:
+        self._calls: Dict[Hashable, asyncio.Future] = {}
+        self._joined: "WeakSet[asyncio.Future]" = WeakSet()
+
+        self.calls: int = 0
+        self.shared: int = 0
+
+    def __len__(self) -> int:
+        return len(self._calls)
+
+    def _done(self, key: Hashable, future: asyncio.Future) -> None:
+        if self._calls.get(key) is future:
+            del self._calls[key]
+
+        # Retrieved here so a failure nobody waits for anymore is not logged.
+        if not future.cancelled():
+            future.exception()
+
+    async def do(self, key: Hashable, call: Callable[[], Awaitable[Any]]) -> Any:
+        # Concurrent calls with the same key share the first one's result,
+        # shielded so one cancelled waiter doesn't cancel it for the others.
+        # A shared result is copied for every waiter, they may mutate it.
+        if (future := self._calls.get(key)) is not None:
+            self.shared += 1
+            self._joined.add(future)
+            return clone(await asyncio.shield(future))
+
+        self.calls += 1
+
+        future = asyncio.ensure_future(call())
+        future.add_done_callback(lambda future: self._done(key, future))
+
+        self._calls[key] = future
+        result = await asyncio.shield(future)
+
+        return clone(result) if future in self._joined else result
+
+
+# "METHOD /path" pattern -> seconds, for reads that rarely change.
+DEFAULT_TTLS: Dict[str, float] = {
+    r"^GET /community/info":                300,
+    r"^(GET|POST) /link-resolution":        3600,
+    r"^GET /user-profile/[^/?]+(\?|$)":     60,
+    r"^GET /chat/thread/[^/?]+(\?|$)":      60,
+    r"^GET /sticker-collection/[^/?]+":     3600,
+    r"^GET /blog-category":                 600
+}
+
+# Writes that change cached reads with an unrelated path.
+DEFAULT_RELATED: Dict[str, List[str]] = {
+    r"^/community/(settings|configuration|guideline)": ["/community/info"]
+}
+
+
+class ResponseCache:
+    def __init__(
+        self,
+        ttls: Optional[Dict[str, float]] = None,
+        maxsize: int = 1024,
+        related: Optional[Dict[str, List[str]]] = None
+    ) -> None:
+        self.maxsize: int = maxsize
+        self.rules: List[Tuple[Pattern, float]] = [
+            (re.compile(pattern), ttl) for pattern, ttl in (DEFAULT_TTLS if ttls is None else ttls).items()]
+        self.related: List[Tuple[Pattern, List[str]]] = [
+            (re.compile(pattern), paths) for pattern, paths in (DEFAULT_RELATED if related is None else related).items()]
+
+        # (ndc, path, sid, body) -> (expires, response)
+        self._entries: "OrderedDict[Tuple, Tuple[float, Any]]" = OrderedDict()
+
+        self.hits: int = 0
+        self.misses: int = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def ttl(self, method: str, path: str) -> Optional[float]:
+        request = f"{method} {path}"
+
+        for pattern, ttl in self.rules:
+            if pattern.search(request):
+                return ttl
+
+    def get(self, key: Tuple) -> Optional[Any]:
+        if (entry := self._entries.get(key)) is None or entry[0] < monotonic():
+            if entry is not None:
+                del self._entries[key]
+
+            self.misses += 1
+            return None
+
+        self.hits += 1
+        self._entries.move_to_end(key)
+
+        return clone(entry[1])
+
+    def set(self, key: Tuple, response: Any, ttl: float) -> None:
+        # Stored and returned as copies, callers may mutate raw responses.
+        self._entries[key] = (monotonic() + ttl, clone(response))
+        self._entries.move_to_end(key)
+
+        if len(self._entries) > self.maxsize:
+            self._entries.popitem(last=False)
+
+    def invalidate(self, path: str, ndc_id: Optional[int] = None) -> int:
+        # Drops entries on the same object: the written path, anything
+        # below it and the objects above it, "/chat/thread/x/admin"
+        # drops "/chat/thread/x", plus the explicitly related reads.
+        path = path.split("?", 1)[0]
+        paths = [path] + [related for pattern, related_paths in self.related 
+                          if pattern.search(path) for related in related_paths]
+
+        def affected(cached: str) -> bool:
+            cached = cached.split("?", 1)[0]
+            return any(cached == written or cached.startswith(written + "/") or written.startswith(cached + "/") 
+                       for written in paths)
+
+        keys = [key for key in self._entries 
+                if (ndc_id is None or key[0] == ndc_id) and affected(key[1])]
+
+        for key in keys:
+            del self._entries[key]
+        return len(keys)
+
+    def clear(self) -> None:
+        self._entries.clear()
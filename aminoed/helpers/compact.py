@@ -0,0 +1,118 @@
+from sys import intern
+from typing import Any, Dict, FrozenSet, Iterable, List, Optional, Tuple, Type, Union
+
+from .models import Message, Model, UserProfile
+
+ProfileKey = Tuple[Optional[int], str]
+
+
+class CompactModel:
+    __slots__ = ()
+
+    MODEL: Type[Model] = Model
+    INTERNED: FrozenSet[str] = frozenset()
+
+    def __init__(self, **data: Any) -> None:
+        for name in self.__slots__:
+            value = data.get(name)
+
+            if name in self.INTERNED and isinstance(value, str):
+                value = intern(value)
+
+            setattr(self, name, value)
+
+    def merge(self, data: Dict) -> bool:
+        # Updates the fields a newer payload changed, missing keys are kept.
+        changed = False
+
+        for name in self.__slots__:
+            if (value := data.get(name)) is None or value == getattr(self, name):
+                continue
+
+            if name in self.INTERNED and isinstance(value, str):
+                value = intern(value)
+
+            setattr(self, name, value)
+            changed = True
+
+        return changed
+
+    @classmethod
+    def from_dict(cls, data: Dict) -> 'CompactModel':
+        return cls(**data)
+
+    @classmethod
+    def from_model(cls, model: Model) -> 'CompactModel':
+        return cls(**{name: getattr(model, name, None) for name in cls.__slots__})
+
+    def to_dict(self) -> Dict:
+        return {name: getattr(self, name) for name in self.__slots__}
+
+    def to_model(self) -> Model:
+        return self.MODEL(**self.to_dict())
+
+    def __eq__(self, other: Any) -> bool:
+        return type(other) is type(self) and self.to_dict() == other.to_dict()
+
+    def __repr__(self) -> str:
+        fields = ", ".join(f"{name}={getattr(self, name)!r}" for name in self.__slots__)
+        return f"{type(self).__name__}({fields})"
+
+
+class CompactUserProfile(CompactModel):
+    __slots__ = ("uid", "nickname", "icon", "ndcId", "level", "reputation", "role", "status")
+
+    MODEL = UserProfile
+    INTERNED = frozenset(("uid", "nickname", "icon"))
+
+
+class CompactMessage(CompactModel):
+    __slots__ = ("messageId", "threadId", "uid", "content", "type", "mediaType",
+                 "mediaValue", "clientRefId", "createdTime", "author")
+
+    MODEL = Message
+    INTERNED = frozenset(("threadId", "uid", "mediaValue"))
+
+    def __init__(self, profiles: Optional[Dict[ProfileKey, CompactUserProfile]] = None, **data: Any) -> None:
+        super().__init__(**data)
+
+        # Authors are shared through `profiles` ((ndcId, uid) -> profile) when
+        # given, profiles are per community. A newer payload updates the shared one.
+        if (author := self.author) is not None and not isinstance(author, CompactUserProfile):
+            if not isinstance(author, dict):
+                author = {name: getattr(author, name, None) for name in CompactUserProfile.__slots__}
+
+            key = (author.get("ndcId", data.get("ndcId")), author.get("uid"))
+
+            if profiles is not None and key in profiles:
+                self.author = profiles[key]
+                self.author.merge(author)
+            else:
+                self.author = CompactUserProfile.from_dict(author)
+
+                if profiles is not None and key[1] is not None:
+                    profiles[key] = self.author
+
+    @classmethod
+    def from_dict(cls, data: Dict, profiles: Optional[Dict[ProfileKey, CompactUserProfile]] = None) -> 'CompactMessage':
+        return cls(profiles, **data)
+
+    @classmethod
+    def from_model(cls, model: Message, profiles: Optional[Dict[ProfileKey, CompactUserProfile]] = None) -> 'CompactMessage':
+        return cls(profiles, **{name: getattr(model, name, None) for name in cls.__slots__})
+
+    def to_dict(self) -> Dict:
+        data = super().to_dict()
+
+        if isinstance(self.author, CompactUserProfile):
+            data["author"] = self.author.to_dict()
+        return data
+
+
+def compact_messages(
+    messages: Iterable[Union[Dict, Message]], 
+    profiles: Optional[Dict[ProfileKey, CompactUserProfile]] = None
+) -> List[CompactMessage]:
+    profiles = {} if profiles is None else profiles
+    return [CompactMessage.from_dict(o, profiles) if isinstance(o, dict)
+            else CompactMessage.from_model(o, profiles) for o in messages]
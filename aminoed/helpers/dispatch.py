@@ -0,0 +1,105 @@
+import asyncio
+
+from typing import Any, Dict, Iterator, List, Optional
+
+from .types import BackpressureTypes
+
+
+class CommandRouter:
+    END: str = ""
+
+    def __init__(self) -> None:
+        self._root: Dict[str, Dict] = {}
+        self.commands: List[str] = []
+
+    def add(self, command: str) -> str:
+        command = command.lower()
+        node = self._root
+
+        for char in command:
+            node = node.setdefault(char, {})
+
+        if self.END not in node:
+            node[self.END] = command
+            self.commands.append(command)
+
+        return command
+
+    append = add
+
+    def match(self, content: str) -> Optional[str]:
+        # content must be lowercased by the caller, once per message.
+        node = self._root
+        matched = node.get(self.END)
+
+        for char in content:
+            if (node := node.get(char)) is None:
+                break
+
+            if self.END in node:
+                matched = node[self.END]
+
+        return matched
+
+    def __contains__(self, command: str) -> bool:
+        command = command.lower()
+        return self.match(command) == command
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self.commands)
+
+    def __len__(self) -> int:
+        return len(self.commands)
+
+
+class EventQueue:
+    def __init__(
+        self,
+        maxsize: int = 1000,
+        backpressure: str = BackpressureTypes.BLOCK
+    ) -> None:
+        if backpressure not in (BackpressureTypes.BLOCK, 
+                BackpressureTypes.DROP_OLDEST, BackpressureTypes.DROP_NEWEST):
+            raise Exception(f"Unknown backpressure policy: {backpressure}")
+        
+        self.backpressure: str = backpressure
+        self._queue: asyncio.Queue = asyncio.Queue(maxsize)
+
+        self.received: int = 0
+        self.processed: int = 0
+        self.dropped: int = 0
+
+    @property
+    def depth(self) -> int:
+        return self._queue.qsize()
+
+    @property
+    def maxsize(self) -> int:
+        return self._queue.maxsize
+
+    async def put(self, item: Any) -> None:
+        self.received += 1
+
+        if self.backpressure == BackpressureTypes.BLOCK:
+            return await self._queue.put(item)
+
+        if self._queue.full():
+            self.dropped += 1
+
+            if self.backpressure == BackpressureTypes.DROP_NEWEST:
+                return
+
+            self._queue.get_nowait()
+            self._queue.task_done()
+
+        self._queue.put_nowait(item)
+
+    async def get(self) -> Any:
+        return await self._queue.get()
+
+    def task_done(self) -> None:
+        self.processed += 1
+        self._queue.task_done()
+
+    async def join(self) -> None:
+        await self._queue.join()
@@ -1,24 +1,62 @@
-from copy import copy
-from typing import Any, Optional, Union
+from collections import OrderedDict
+from typing import Optional, Tuple, Union
+
+from pydantic import PrivateAttr
 
 from ..client import Client
 from ..http import WebHttpClient
 from .models import Auth, BaseEvent, Message
 
+CLIENTS_LIMIT = 256
+CLIENTS: "OrderedDict[Tuple[int, Optional[str]], Client]" = OrderedDict()
+
+
+def community_client(auth: Auth, ndc_id: int) -> Client:
+    key = (ndc_id, auth.sid)
+    
+    if (client := CLIENTS.get(key)) is not None:
+        CLIENTS.move_to_end(key)
+        return client
+    
+    client = Client(ndc_id, auth.deviceId, check_updates=False)
+    client.auth = auth
+    
+    CLIENTS[key] = client
+    
+    if len(CLIENTS) > CLIENTS_LIMIT:
+        CLIENTS.popitem(last=False)
+    
+    return client
+
+
 class Event(BaseEvent):
-    def __init__(self, auth: Auth, data) -> None:
+    _auth: Auth = PrivateAttr()
+    _owner: Optional[Client] = PrivateAttr(None)
+    
+    def __init__(self, auth: Auth, data, owner: Optional[Client] = None) -> None:
         super().__init__(**data, **data["chatMessage"])
+        self._auth = auth
+        self._owner = owner
+    
+    @classmethod
+    def parse_lazy(cls, auth: Auth, data, owner: Optional[Client] = None) -> 'Event':
+        event = cls.lazy(**data, **data["chatMessage"])
+        event._auth = auth
+        event._owner = owner
         
-        self.client: Client = Client(self.ndcId, check_updates=False)
-        self.client.auth = auth
-        self.client.ndc_id = self.ndcId
-        
-        self.client.ndc_id = self.ndcId
-        
-        self.web: WebHttpClient = self.client.web
+        return event
+    
+    @property
+    def client(self) -> Client:
+        # A view of the client owning the websocket, so replies go through
+        # its rate limiter, retry policy and caches.
+        if self._owner is not None:
+            return self._owner.community_view(self.ndcId)
+        return community_client(self._auth, self.ndcId)
     
-    client: Optional[Any] = None
-    web: Optional[Any] = None
+    @property
+    def web(self) -> WebHttpClient:
+        return self.client.web
         
     async def send_message(
         self, 
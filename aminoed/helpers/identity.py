@@ -0,0 +1,127 @@
+from collections import OrderedDict
+from typing import Any, Dict, List, Optional, Tuple, Type
+
+from pydantic import ValidationError
+from pydantic.fields import SHAPE_LIST, SHAPE_SINGLETON, ModelField
+
+from .models import Model, UserProfile
+
+ProfileKey = Tuple[Optional[int], str]
+
+
+class IdentityMap:
+    def __init__(self, limit: int = 100000) -> None:
+        self.limit: int = limit
+
+        # (ndcId, uid) -> (shared profile, merged raw payload)
+        self._profiles: "OrderedDict[ProfileKey, Tuple[UserProfile, Dict]]" = OrderedDict()
+        self._fields: Dict[Type[Model], Dict[str, ModelField]] = {}
+
+        self.hits: int = 0
+        self.merges: int = 0
+        self.misses: int = 0
+
+    def profile_fields(self, model: Type[Model]) -> Dict[str, ModelField]:
+        # alias -> field for every UserProfile (or list of them) on the model.
+        if (fields := self._fields.get(model)) is None:
+            fields = self._fields[model] = {
+                field.alias: field for field in model.__fields__.values()
+                if field.type_ is UserProfile and field.shape in (SHAPE_SINGLETON, SHAPE_LIST)
+            }
+        return fields
+
+    def get(self, uid: str, ndc_id: Optional[int] = None) -> Optional[UserProfile]:
+        if (entry := self._profiles.get((ndc_id, uid))) is not None:
+            return entry[0]
+
+    def profile(self, data: Dict, lazy: bool = False, ndc_id: Optional[int] = None) -> UserProfile:
+        # ndc_id is the parent object's community, for authors without their own.
+        if (uid := data.get("uid")) is None:
+            return UserProfile.lazy(**data) if lazy else UserProfile(**data)
+
+        key = (data.get("ndcId", ndc_id), uid)
+
+        if (entry := self._profiles.get(key)) is None:
+            self.misses += 1
+            profile = UserProfile.lazy(**data) if lazy else UserProfile(**data)
+
+            self._profiles[key] = (profile, dict(data))
+
+            if len(self._profiles) > self.limit:
+                self._profiles.popitem(last=False)
+            return profile
+
+        self._profiles.move_to_end(key)
+        profile, raw = entry
+
+        # Only the keys that changed since the last payload are validated,
+        # keys missing from a partial payload (member summaries) are kept.
+        changed = {name: value for name, value in data.items() if raw.get(name) != value}
+
+        if not changed:
+            self.hits += 1
+            return profile
+
+        self.merges += 1
+        self.merge(profile, changed)
+        raw.update(changed)
+
+        return profile
+
+    def merge(self, profile: UserProfile, data: Dict) -> None:
+        for name, field in profile.__fields__.items():
+            if field.alias not in data:
+                continue
+
+            value, errors = field.validate(data[field.alias], profile.__dict__, loc=name, cls=type(profile))
+
+            if errors:
+                raise ValidationError([errors], type(profile))
+
+            if profile._lazy:
+                profile._lazy.pop(name, None)
+
+            profile.__dict__[name] = value
+            profile.__fields_set__.add(name)
+
+    def parse(self, model: Type[Model], data: Dict, lazy: bool = False) -> Model:
+        if model is UserProfile:
+            return self.profile(data, lazy)
+
+        if not (fields := self.profile_fields(model)):
+            return model.lazy(**data) if lazy else model(**data)
+
+        profiles = {alias: data[alias] for alias in fields if data.get(alias) is not None}
+
+        if profiles:
+            data = {key: value for key, value in data.items() if key not in profiles}
+
+        obj = model.lazy(**data) if lazy else model(**data)
+        ndc_id = data.get("ndcId")
+
+        for alias, value in profiles.items():
+            field = fields[alias]
+
+            if field.shape == SHAPE_LIST:
+                value = [self.profile(o, lazy, ndc_id) if isinstance(o, dict) else o for o in value]
+            elif isinstance(value, dict):
+                value = self.profile(value, lazy, ndc_id)
+
+            obj.__dict__[field.name] = value
+            obj.__fields_set__.add(field.name)
+
+        return obj
+
+    def parse_list(self, model: Type[Model], objects: List[Dict], lazy: bool = False, **extra: Any) -> List[Model]:
+        if extra:
+            return [self.parse(model, {**o, **extra}, lazy) for o in objects]
+        return [self.parse(model, o, lazy) for o in objects]
+
+    def clear(self) -> None:
+        self._profiles.clear()
+
+    def __len__(self) -> int:
+        return len(self._profiles)
+
+    def __contains__(self, key: ProfileKey) -> bool:
+        return key in self._profiles
@@ -1,10 +1,114 @@
 import sys
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, PrivateAttr, ValidationError
+from pydantic.fields import SHAPE_LIST, SHAPE_SINGLETON, ModelField
 from typing import List, Optional, Any, Union, Dict
 
 
-class RestrictionInfo(BaseModel):
+def _contains_model(field: ModelField) -> bool:
+    if isinstance(field.type_, type) and issubclass(field.type_, BaseModel):
+        return True
+    return any(_contains_model(sub_field) for sub_field in field.sub_fields or ())
+
+
+class Model(BaseModel):
+    _lazy: Optional[Dict[str, Any]] = PrivateAttr(None)
+    
+    @classmethod
+    def lazy_fields(cls) -> Dict[str, Optional[type]]:
+        # name -> None for fields holding a model anywhere (Union, Dict...),
+        # built on first access. Else the JSON type stored without coercion,
+        # object for Any and NotImplemented for fields always validated.
+        if "__lazy_fields__" not in cls.__dict__:
+            cls.__lazy_fields__ = {}
+            
+            for name, field in cls.__fields__.items():
+                if _contains_model(field):
+                    cls.__lazy_fields__[name] = None
+                elif field.shape == SHAPE_SINGLETON and field.type_ in (str, int, float, bool):
+                    cls.__lazy_fields__[name] = field.type_
+                elif field.shape == SHAPE_SINGLETON and field.type_ is Any:
+                    cls.__lazy_fields__[name] = object
+                else:
+                    cls.__lazy_fields__[name] = NotImplemented
+        return cls.__lazy_fields__
+    
+    @classmethod
+    def lazy(cls, **data) -> 'Model':
+        # Scalars of the right JSON type are taken as is, others are 
+        # coerced like the eager path, nested models are only built 
+        # (lazily as well) on first attribute access.
+        lazy_fields = cls.lazy_fields()
+        values, pending = {}, {}
+        
+        for name, field in cls.__fields__.items():
+            if (value := data.get(field.alias)) is None:
+                continue
+            
+            if (kind := lazy_fields[name]) is None:
+                pending[name] = value
+            elif kind is object or type(value) is kind:
+                values[name] = value
+            else:
+                values[name], errors = field.validate(value, values, loc=name, cls=cls)
+                
+                if errors:
+                    raise ValidationError([errors], cls)
+        
+        model = cls.construct(**values)
+        
+        for name in pending:
+            model.__dict__.pop(name, None)
+        
+        model._lazy = pending or None
+        return model
+    
+    def __getattr__(self, name: str) -> Any:
+        lazy = self._lazy
+        
+        if not lazy or name not in lazy:
+            raise AttributeError(f"'{type(self).__name__}' object has no attribute '{name}'")
+        
+        value = self._build(name, lazy.pop(name))
+        
+        self.__dict__[name] = value
+        self.__fields_set__.add(name)
+        
+        return value
+    
+    def _build(self, name: str, value: Any) -> Any:
+        field = self.__fields__[name]
+        
+        if isinstance(field.type_, type) and issubclass(field.type_, Model):
+            if field.shape == SHAPE_SINGLETON and isinstance(value, dict):
+                return field.type_.lazy(**value)
+            
+            if field.shape == SHAPE_LIST and isinstance(value, list):
+                return [field.type_.lazy(**o) if isinstance(o, dict) else o for o in value]
+        
+        value, errors = field.validate(value, self.__dict__, loc=name, cls=type(self))
+        
+        if errors:
+            raise ValidationError([errors], type(self))
+        return value
+    
+    def _materialize(self) -> None:
+        for name in list(self._lazy or ()):
+            if name in self.__dict__:
+                self._lazy.pop(name)
+            else:
+                getattr(self, name)
+    
+    def _iter(self, *args, **kwargs):
+        self._materialize()
+        return super()._iter(*args, **kwargs)
+    
+    def __repr_args__(self):
+        self._materialize()
+        return super().__repr_args__()
+
+
+class RestrictionInfo(Model):
     discountStatus:    Optional[int]
     ownerUid:          Optional[str]
     ownerType:         Optional[int]
@@ -14,7 +118,7 @@ class RestrictionInfo(BaseModel):
     discountValue:     Optional[int]
 
 
-class AvatarFrame(BaseModel):
+class AvatarFrame(Model):
     class Config(BaseModel):
         name:                Optional[str]
         version:             Optional[int]
@@ -23,7 +127,7 @@ class AvatarFrame(BaseModel):
         id:                  Optional[str]
         moodColor:           Optional[str]
 
-    class OwnershipInfo(BaseModel):
+    class OwnershipInfo(Model):
         isAutoRenew:     Optional[bool]
         expiredTime:     Optional[str]
         createdTime:     Optional[str]
@@ -51,9 +155,9 @@ class AvatarFrame(BaseModel):
     resourceUrl:         Optional[str]
 
 
-class Account(BaseModel):
-    class Extensions(BaseModel):
-        class DeviceInfo(BaseModel):
+class Account(Model):
+    class Extensions(Model):
+        class DeviceInfo(Model):
             lastClientType: Optional[int]
 
         deviceInfo:      Optional[DeviceInfo]
@@ -64,7 +168,7 @@ class Account(BaseModel):
         avatarFrameId:   Optional[str]
         adsEnabled:      Optional[bool]
 
-    class AdvancedSettings(BaseModel):
+    class AdvancedSettings(Model):
         analyticsEnabled: Optional[int]
 
     extensions:            Optional[Extensions]
@@ -92,16 +196,16 @@ class Account(BaseModel):
     email:                 Optional[str]
 
 
-class UserProfile(BaseModel):
-    class Settings(BaseModel):
+class UserProfile(Model):
+    class Settings(Model):
         onlineStatus: Optional[int]
 
-    class Extensions(BaseModel):
-        class Style(BaseModel):
+    class Extensions(Model):
+        class Style(Model):
             backgroundColor:     Optional[str]
             backgroundMediaList: Optional[List[List]]
             
-        class Title(BaseModel):
+        class Title(Model):
             color: Optional[str]
             title: Optional[str]
 
@@ -118,7 +222,7 @@ class UserProfile(BaseModel):
         privilegeOfChatInviteRequest:    Optional[int]
         privilegeOfCommentOnUserProfile: Optional[int]
 
-    class InfluencerInfo(BaseModel):
+    class InfluencerInfo(Model):
         fansCount:   Optional[int]
         monthlyFee:  Optional[int]
         pinned:      Optional[bool]
@@ -162,7 +266,7 @@ class UserProfile(BaseModel):
     blogsCount:              Optional[int]
 
 
-class Auth(BaseModel):
+class Auth(Model):
     auid:     Optional[str]
     account:  Optional[Account]
     sid:      Optional[str]
@@ -173,15 +277,15 @@ class Auth(BaseModel):
     
 
 
-class Community(BaseModel):
-    class AdvancedSettings(BaseModel):
-        class RankingTableItem(BaseModel):
+class Community(Model):
+    class AdvancedSettings(Model):
+        class RankingTableItem(Model):
             title:      Optional[str]
             level:      Optional[int]
             reputation: Optional[int]
             id:         Optional[int]
 
-        class NewsFeedPage(BaseModel):
+        class NewsFeedPage(Model):
             status: Optional[int]
             type:   Optional[int]
 
@@ -198,29 +302,29 @@ class Community(BaseModel):
         welcomeMessageEnabled:           Optional[Any]
         catalogEnabled:                  Optional[bool]
 
-    class UserAddedTopic(BaseModel):
-        class Style(BaseModel):
+    class UserAddedTopic(Model):
+        class Style(Model):
             backgroundColor: Optional[str]
 
         style:   Optional[Style]
         topicId: Optional[int]
         name:    Optional[str]
 
-    class ThemePack(BaseModel):
+    class ThemePack(Model):
         themePackHash:     Optional[str]
         themePackRevision: Optional[int]
         themePackUrl:      Optional[str]
         themeColor:        Optional[str]
 
-    class Configuration(BaseModel):
-        class Module(BaseModel):
-            class Ranking(BaseModel):
-                class Leaderboard(BaseModel):
+    class Configuration(Model):
+        class Module(Model):
+            class Ranking(Model):
+                class Leaderboard(Model):
                     type:    Optional[int]
                     id:      Optional[int]
                     enabled: Optional[bool]
 
-                class Table(BaseModel):
+                class Table(Model):
                     id: Optional[int]
                     title:      Optional[str]
                     level:      Optional[int]
@@ -232,15 +336,15 @@ class Community(BaseModel):
                 rankingTable:           Optional[List[Table]]
                 defaultLeaderboardType: Optional[int]
 
-            class Chat(BaseModel):
-                class AvChat(BaseModel):
+            class Chat(Model):
+                class AvChat(Model):
                     audioEnabled:         Optional[bool]
                     videoEnabled:         Optional[bool]
                     audio2Enabled:        Optional[bool]
                     screeningRoomEnabled: Optional[bool]
 
-                class PublicChat(BaseModel):
-                    class Privilege(BaseModel):
+                class PublicChat(Model):
+                    class Privilege(Model):
                         type:     Optional[int]
                         minLevel: Optional[int]
 
@@ -252,13 +356,13 @@ class Community(BaseModel):
                 spamProtectionEnabled: Optional[bool]
                 enabled:               Optional[bool]
 
-            class ExternalContent(BaseModel):
+            class ExternalContent(Model):
                 enabled: Optional[bool]
 
-            class Post(BaseModel):
-                class PostType(BaseModel):
-                    class Type(BaseModel):
-                        class Privilege(BaseModel):
+            class Post(Model):
+                class PostType(Model):
+                    class Type(Model):
+                        class Privilege(Model):
                             type:     Optional[int]
                             minLevel: int = 0
 
@@ -280,27 +384,27 @@ class Community(BaseModel):
                 postType: Optional[PostType]
                 enabled:  Optional[bool]
 
-            class Influencer(BaseModel):
+            class Influencer(Model):
                 enabled:          Optional[bool]
                 maxVipMonthlyFee: Optional[int]
                 minVipMonthlyFee: Optional[int]
                 lock:             Optional[bool]
                 maxVipNumbers:    Optional[int]
 
-            class Catalog(BaseModel):
-                class Privilege(BaseModel):
+            class Catalog(Model):
+                class Privilege(Model):
                     type: Optional[int]
 
                 privilege:       Optional[Privilege]
                 enabled:         Optional[bool]
                 curationEnabled: Optional[bool]
 
-            class SharedFolder(BaseModel):
-                class AlbumManagePrivilege(BaseModel):
+            class SharedFolder(Model):
+                class AlbumManagePrivilege(Model):
                     type:     Optional[int]
                     minLevel: Optional[int]
 
-                class UploadPrivilege(BaseModel):
+                class UploadPrivilege(Model):
                     minLevel: Optional[int]
                     type:     Optional[int]
 
@@ -308,7 +412,7 @@ class Community(BaseModel):
                 albumManagePrivilege: Optional[AlbumManagePrivilege]
                 enabled:              Optional[bool]
 
-            class Featured(BaseModel):
+            class Featured(Model):
                 enabled:               Optional[bool]
                 lockMember:            Optional[bool]
                 postEnabled:           Optional[bool]
@@ -325,8 +429,8 @@ class Community(BaseModel):
             sharedFolder:    Optional[SharedFolder]
             featured:        Optional[Featured]
 
-        class General(BaseModel):
-            class WelcomeMessage(BaseModel):
+        class General(Model):
+            class WelcomeMessage(Model):
                 enabled: Optional[bool]
                 text:    Optional[str]
 
@@ -344,22 +448,22 @@ class Community(BaseModel):
             disableLiveLayerActive:         Optional[bool]
             facebookAppIdList:              Optional[Any]
 
-        class Appearance(BaseModel):
-            class HomePage(BaseModel):
-                class IdObj(BaseModel):
+        class Appearance(Model):
+            class HomePage(Model):
+                class IdObj(Model):
                     id: Optional[str]
 
                 navigation: Optional[List[IdObj]]
 
-            class LeftSidePanel(BaseModel):
-                class Navigation(BaseModel):
-                    class IdObj(BaseModel):
+            class LeftSidePanel(Model):
+                class Navigation(Model):
+                    class IdObj(Model):
                         id: Optional[str]
 
                     level2: Optional[List[IdObj]]
                     level1: Optional[List[IdObj]]
 
-                class Style(BaseModel):
+                class Style(Model):
                     iconColor: Optional[str]
 
                 navigation: Optional[Navigation]
@@ -368,8 +472,8 @@ class Community(BaseModel):
             homePage:      Optional[HomePage]
             leftSidePanel: Optional[LeftSidePanel]
 
-        class Page(BaseModel):
-            class DefaultObject(BaseModel):
+        class Page(Model):
+            class DefaultObject(Model):
                 url:   Optional[str]
                 alias: Optional[Any]
                 id:    Optional[str]
@@ -416,7 +520,7 @@ class Community(BaseModel):
     promotionalMediaList:               Optional[List[List]]
 
 
-class ChatBubble(BaseModel):
+class ChatBubble(Model):
     class Config(BaseModel):
         status:               Optional[int]
         allowedSlots:         Optional[List[Dict]]
@@ -454,8 +558,8 @@ class ChatBubble(BaseModel):
     md5:             Optional[str]
 
 
-class TipInfo(BaseModel):
-    class TipOption(BaseModel):
+class TipInfo(Model):
+    class TipOption(Model):
         value: Optional[int]
         icon:  Optional[str]
 
@@ -468,9 +572,9 @@ class TipInfo(BaseModel):
     tippedCoins:     Optional[float]
 
 
-class Thread(BaseModel):
-    class Topic(BaseModel):
-        class Style(BaseModel):
+class Thread(Model):
+    class Topic(Model):
+        class Style(Model):
             backgroundColor: Optional[str]
 
         status:                  Optional[int]
@@ -495,7 +599,7 @@ class Thread(BaseModel):
         tabList:                 Optional[List]
         objectMappingScore:      Optional[int]
 
-    class Member(BaseModel):
+    class Member(Model):
         status:           Optional[int]
         uid:              Optional[str]
         membershipStatus: Optional[int]
@@ -503,7 +607,7 @@ class Thread(BaseModel):
         nickname:         Optional[str]
         icon:             Optional[str]
 
-    class LastMessage(BaseModel):
+    class LastMessage(Model):
         uid:         Optional[str]
         type:        Optional[int]
         mediaType:   Optional[int]
@@ -513,8 +617,8 @@ class Thread(BaseModel):
         isHidden:    Optional[bool]
         mediaValue:  Optional[Any]
 
-    class Extensions(BaseModel):
-        class ScreeningRoomPermission(BaseModel):
+    class Extensions(Model):
+        class ScreeningRoomPermission(Model):
             action:  Optional[int]
             uidList: Optional[List]
 
@@ -565,7 +669,7 @@ class Thread(BaseModel):
     chatBubbles:        Optional[Dict[str, ChatBubble]]
 
 
-class Sticker(BaseModel):
+class Sticker(Model):
     status:              Optional[int]
     iconV2:              Optional[str]
     name:                Optional[str]
@@ -581,9 +685,9 @@ class Sticker(BaseModel):
     icon:                Optional[str]
 
 
-class Message(BaseModel):
-    class Extensions(BaseModel):
-        class Mention(BaseModel):
+class Message(Model):
+    class Extensions(Model):
+        class Mention(Model):
             uid: str
 
         sticker:           Optional[Sticker]
@@ -619,10 +723,10 @@ class Message(BaseModel):
             "author": {}, "extensions": {"sticker": {}}, "chatBubble": {}}))
 
 
-class Blog(BaseModel):
-    class QuizQuestion(BaseModel):
-        class Extensions(BaseModel):
-            class QuestionOpt(BaseModel):
+class Blog(Model):
+    class QuizQuestion(Model):
+        class Extensions(Model):
+            class QuestionOpt(Model):
                 optId: Optional[str]
                 qhash: Optional[str]
                 title: Optional[str]
@@ -639,8 +743,8 @@ class Blog(BaseModel):
         parentId:       Optional[str]
         mediaList:      Optional[List[List]]
 
-    class Extensions(BaseModel):
-        class Style(BaseModel):
+    class Extensions(Model):
+        class Style(Model):
             coverMediaIndexList: Optional[Any]
             backgroundMediaList: Optional[List[List]]
 
@@ -685,8 +789,8 @@ class Blog(BaseModel):
     prevPageToken:         Optional[str]
 
 
-class Wiki(BaseModel):
-    class Extensions(BaseModel):
+class Wiki(Model):
+    class Extensions(Model):
         fansOnly: Optional[bool]
 
     globalVotesCount:    Optional[int]
@@ -713,7 +817,7 @@ class Wiki(BaseModel):
     commentsCount:       Optional[int]
 
 
-class Comment(BaseModel):
+class Comment(Model):
     modifiedTime:     Optional[str]
     ndcId:            Optional[int]
     votedValue:       Optional[int]
@@ -731,7 +835,7 @@ class Comment(BaseModel):
     type:             Optional[int]
 
 
-class Link(BaseModel):
+class Link(Model):
     objectId:   Optional[str]
     targetCode: Optional[int]
     ndcId:      Optional[int]
@@ -742,8 +846,8 @@ class Link(BaseModel):
     community:  Optional[Community]
 
 
-class Wallet(BaseModel):
-    class AdsVideoStats(BaseModel):
+class Wallet(Model):
+    class AdsVideoStats(Model):
         watchVideoMaxCount:     Optional[int]
         nextWatchVideoInterval: Optional[float]
         watchedVideoCount:      Optional[int]
@@ -761,8 +865,8 @@ class Wallet(BaseModel):
     businessCoinsEnabled:    Optional[bool]
 
 
-class Transaction(BaseModel):
-    class ExtData(BaseModel):
+class Transaction(Model):
+    class ExtData(Model):
         icon: Optional[str]
         subtitle: Optional[str]
         objectDeeplinkUrl: Optional[str]
@@ -785,7 +889,7 @@ class Transaction(BaseModel):
     originCoinsFloat:  Optional[float]
 
 
-class Membership(BaseModel):
+class Membership(Model):
     uid:              Optional[str]
     paymentType:      Optional[int]
     expiredTime:      Optional[str]
@@ -796,7 +900,7 @@ class Membership(BaseModel):
     membershipStatus: Optional[int]
 
 
-class InviteCode(BaseModel):
+class InviteCode(Model):
     status:       Optional[int]
     duration:     Optional[int]
     invitationId: Optional[str]
@@ -807,9 +911,9 @@ class InviteCode(BaseModel):
     inviteCode:   Optional[str]
 
 
-class StickerCollection(BaseModel):
-    class Extensions(BaseModel):
-        class OriginalCommunity(BaseModel):
+class StickerCollection(Model):
+    class Extensions(Model):
+        class OriginalCommunity(Model):
             status:   Optional[int]
             icon:     Optional[str]
             endpoint: Optional[str]
@@ -843,8 +947,8 @@ class StickerCollection(BaseModel):
     restrictionInfo:     Optional[RestrictionInfo]
 
 
-class Lottery(BaseModel):
-    class LotteryLog(BaseModel):
+class Lottery(Model):
+    class LotteryLog(Model):
         awardValue:  Optional[int]
         parentType:  Optional[int]
         objectId:    Optional[str]
@@ -858,15 +962,15 @@ class Lottery(BaseModel):
     lotteryLog: Optional[LotteryLog]
 
 
-class Achievement(BaseModel):
+class Achievement(Model):
     secondsSpentOfLast24Hours: Optional[float]
     secondsSpentOfLast7Days:   Optional[float]
     numberOfMembersCount:      Optional[int]
     numberOfPostsCreated:      Optional[int]
 
 
-class CheckIn(BaseModel):
-    class CheckInHistory(BaseModel):
+class CheckIn(Model):
+    class CheckInHistory(Model):
         joinedTime:             Optional[int]
         stopTime:               Optional[int]
         consecutiveCheckInDays: Optional[int]
@@ -885,21 +989,21 @@ class CheckIn(BaseModel):
     userProfile:               Optional[UserProfile]
 
 
-class TippedUserSummary(BaseModel):
+class TippedUserSummary(Model):
     tipper:           Optional[UserProfile]
     lastTippedTime:   Optional[str]
     totalTippedCoins: Optional[float]
     lastThankedTime:  Optional[str]
 
 
-class Bookmark(BaseModel):
+class Bookmark(Model):
     refObjectType:  Optional[int]
     bookmarkedTime: Optional[str]
     refObjectId:    Optional[str]
     refObject:      Optional[Union[Blog, Wiki]]
 
 
-class QuizRanking(BaseModel):
+class QuizRanking(Model):
     highestMode:    Optional[int]
     modifiedTime:   Optional[str]
     isFinished:     Optional[bool]
@@ -912,7 +1016,7 @@ class QuizRanking(BaseModel):
     author:         Optional[UserProfile]
 
 
-class BlogCategory(BaseModel):
+class BlogCategory(Model):
     blogsCount:   Optional[int]
     status:       Optional[int]
     type:         Optional[int]
@@ -926,14 +1030,14 @@ class BlogCategory(BaseModel):
     content:      Optional[str]
 
 
-class VcReputation(BaseModel):
+class VcReputation(Model):
     participantCount: Optional[int]
     totalReputation:  Optional[int]
     duration:         Optional[int]
 
 
-class AdminLog(BaseModel):
-    class Author(BaseModel):
+class AdminLog(Model):
+    class Author(Model):
         icon:     Optional[str]
         status:   Optional[int]
         role:     Optional[int]
@@ -957,8 +1061,8 @@ class AdminLog(BaseModel):
     logId:           Optional[str]
 
 
-class StoreItem(BaseModel):
-    class ItemBasicInfo(BaseModel):
+class StoreItem(Model):
+    class ItemBasicInfo(Model):
         icon: Optional[str]
         name: Optional[str]
 
@@ -970,7 +1074,7 @@ class StoreItem(BaseModel):
     refObject:           Optional[Union[ChatBubble, AvatarFrame, StickerCollection]]
 
 
-class StoreSections(BaseModel):
+class StoreSections(Model):
     name:                 Optional[str]
     sectionGroupId:       Optional[str]
     allItemsCount:        Optional[int]
@@ -986,7 +1090,7 @@ class BaseEvent(Message):
     __warned__:       Optional[bool] # 🤡
 
 
-class SID(BaseModel):
+class SID(Model):
     signature:  Optional[str]
     prefix:     Optional[str]
     original:   Optional[str]
@@ -997,7 +1101,7 @@ class SID(BaseModel):
     makeTime:   Optional[int] = Field(alias="5")
     clientType: Optional[int] = Field(alias="6")
 
-class CommunityStatistic(BaseModel):
+class CommunityStatistic(Model):
     dailyActiveMembers: Optional[Any]
     monthlyActiveMembers: Optional[Any]
     totalTimeSpent: Optional[Any]
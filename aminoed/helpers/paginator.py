@@ -0,0 +1,196 @@
+import asyncio
+
+from collections import deque
+from typing import Any, AsyncIterator, Awaitable, Callable, Deque, List, Optional, Tuple
+
+
+def discard(task: asyncio.Future) -> None:
+    # A prefetch that already failed is retrieved, else asyncio logs it.
+    if not task.done():
+        task.cancel()
+    elif not task.cancelled():
+        task.exception()
+
+
+class Paginator:
+    def __init__(
+        self,
+        method: Callable[..., Awaitable[List[Any]]],
+        *args: Any,
+        page_size: int = 100,
+        max_items: Optional[int] = None,
+        start: int = 0,
+        concurrency: int = 1,
+        **kwargs: Any
+    ) -> None:
+        self.method: Callable[..., Awaitable[List[Any]]] = method
+        self.args: tuple = args
+        self.kwargs: dict = kwargs
+
+        self.page_size: int = page_size
+        self.max_items: Optional[int] = max_items
+        self.start: int = start
+        self.concurrency: int = max(concurrency, 1)
+
+    async def fetch(self, start: int) -> List[Any]:
+        return await self.method(*self.args, start=start, size=self.page_size, **self.kwargs)
+
+    async def pages(self) -> AsyncIterator[List[Any]]:
+        # Keeps up to `concurrency` page requests in flight ahead of the
+        # consumer, pages are still yielded in order and at most
+        # concurrency + 1 of them are held in memory.
+        next_start = self.start
+        end = None if self.max_items is None else self.start + self.max_items
+        tasks: Deque[Tuple[int, asyncio.Future]] = deque()
+
+        def schedule() -> None:
+            nonlocal next_start
+
+            while len(tasks) < self.concurrency and (end is None or next_start < end):
+                tasks.append((next_start, asyncio.ensure_future(self.fetch(next_start))))
+                next_start += self.page_size
+
+        try:
+            schedule()
+
+            while tasks:
+                start, task = tasks.popleft()
+                page = await task
+
+                if len(page) < self.page_size:
+                    for _, pending in tasks:
+                        discard(pending)
+                    tasks.clear()
+                else:
+                    schedule()
+
+                if end is not None:
+                    page = page[:end - start]
+
+                if page:
+                    yield page
+        finally:
+            for _, pending in tasks:
+                discard(pending)
+
+    async def items(self) -> AsyncIterator[Any]:
+        async for page in self.pages():
+            for item in page:
+                yield item
+
+    def __aiter__(self) -> AsyncIterator[Any]:
+        return self.items()
+
+    async def list(self) -> List[Any]:
+        return [item async for item in self]
+
+
+class PageCursor:
+    def __init__(
+        self,
+        method: Callable[..., Awaitable[List[Any]]],
+        *args: Any,
+        page_size: int = 100,
+        page_token: Optional[str] = None,
+        offset: int = 0,
+        oldest_first: bool = False,
+        until_id: Optional[str] = None,
+        until_time: Optional[str] = None,
+        id_field: str = "messageId",
+        **kwargs: Any
+    ) -> None:
+        self.method: Callable[..., Awaitable[List[Any]]] = method
+        self.args: tuple = args
+        self.kwargs: dict = kwargs
+
+        self.page_size: int = page_size
+        self.oldest_first: bool = oldest_first
+        self.until_id: Optional[str] = until_id
+        self.until_time: Optional[str] = until_time
+        self.id_field: str = id_field
+
+        # Resume position of a newest-first walk: the page holding the next
+        # item and how many of its items were already handed out. items()
+        # advances it per item, pages() per page (a page broken off in the
+        # middle is yielded again). Save both to resume after a break.
+        self.page_token: Optional[str] = page_token
+        self.offset: int = offset
+        # Id of the last item handed out by items(). An oldest-first walk
+        # resumes with until_id=last_id, it stops right after that item.
+        self.last_id: Optional[str] = None
+
+    @staticmethod
+    def value(item: Any, name: str) -> Any:
+        if isinstance(item, dict):
+            return item.get(name)
+        return getattr(item, name, None)
+
+    async def fetch(self, page_token: Optional[str]) -> List[Any]:
+        return await self.method(*self.args, size=self.page_size, page_token=page_token, **self.kwargs)
+
+    def reached(self, item: Any) -> bool:
+        if self.until_id is not None and self.value(item, self.id_field) == self.until_id:
+            return True
+
+        if self.until_time is not None:
+            created_time = self.value(item, "createdTime")
+            return created_time is not None and created_time <= self.until_time
+
+        return False
+
+    def cut(self, page: List[Any]) -> Tuple[List[Any], bool]:
+        for index, item in enumerate(page):
+            if self.reached(item):
+                return page[:index], True
+        return page, False
+
+    async def newest_pages(self) -> AsyncIterator[Tuple[Optional[str], List[Any]]]:
+        token, skip = self.page_token, self.offset
+        task: Optional[asyncio.Future] = asyncio.ensure_future(self.fetch(token))
+
+        try:
+            while task is not None:
+                page = await task
+                task = None
+
+                next_token = self.value(page[-1], "nextPageToken") if page else None
+                page, stopped = self.cut(page)
+
+                if next_token and not stopped:
+                    task = asyncio.ensure_future(self.fetch(next_token))
+
+                if page[skip:]:
+                    yield token, page[skip:]
+
+                # Only reached once the consumer is done with the page.
+                self.page_token = token = None if stopped else next_token
+                self.offset = skip = 0
+        finally:
+            if task is not None:
+                task.cancel()
+
+    async def pages(self) -> AsyncIterator[List[Any]]:
+        if not self.oldest_first:
+            async for _, page in self.newest_pages():
+                yield page
+            return
+
+        # Walk back once remembering only the page tokens, then replay
+        # the pages from the oldest one, memory grows with pages, not items.
+        tokens = [token async for token, _ in self.newest_pages()]
+
+        for token in reversed(tokens):
+            page, _ = self.cut(await self.fetch(token))
+            yield page[::-1]
+
+    async def items(self) -> AsyncIterator[Any]:
+        async for page in self.pages():
+            for item in page:
+                if not self.oldest_first:
+                    self.offset += 1
+                self.last_id = self.value(item, self.id_field)
+
+                yield item
+
+    def __aiter__(self) -> AsyncIterator[Any]:
+        return self.items()
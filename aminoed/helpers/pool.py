@@ -0,0 +1,64 @@
+import asyncio
+
+from typing import List, Optional
+from weakref import WeakKeyDictionary
+
+from aiohttp import BaseConnector, ClientSession, TCPConnector
+
+# Sessions and connectors left to the pool are closed by shutdown(),
+# silence aiohttp's unclosed warnings when the process exits first.
+ClientSession.__del__ = lambda _: None
+BaseConnector.__del__ = lambda _: None
+
+
+class ConnectionPool:
+    def __init__(
+        self,
+        limit: int = 100,
+        limit_per_host: int = 0,
+        keepalive_timeout: float = 60,
+        ttl_dns_cache: Optional[int] = 300
+    ) -> None:
+        self.limit: int = limit
+        self.limit_per_host: int = limit_per_host
+        self.keepalive_timeout: float = keepalive_timeout
+        self.ttl_dns_cache: Optional[int] = ttl_dns_cache
+
+        self._sessions: WeakKeyDictionary = WeakKeyDictionary()
+
+    @property
+    def session(self) -> ClientSession:
+        # One session (and one set of warm connections) per event loop,
+        # created on first use so nothing touches the loop at import time.
+        loop = asyncio.get_running_loop()
+        session: Optional[ClientSession] = self._sessions.get(loop)
+
+        if not session or session.closed:
+            connector = TCPConnector(
+                limit=self.limit,
+                limit_per_host=self.limit_per_host,
+                keepalive_timeout=self.keepalive_timeout,
+                ttl_dns_cache=self.ttl_dns_cache
+            )
+
+            session = ClientSession(connector=connector)
+            self._sessions[loop] = session
+
+        return session
+
+    @property
+    def sessions(self) -> List[ClientSession]:
+        return [session for session in self._sessions.values() if not session.closed]
+
+    async def close(self) -> None:
+        loop = asyncio.get_running_loop()
+
+        if (session := self._sessions.pop(loop, None)) and not session.closed:
+            await session.close()
+
+    def shutdown(self) -> None:
+        for session in self.sessions:
+            if session.connector:
+                session.connector._close()
+
+        self._sessions.clear()
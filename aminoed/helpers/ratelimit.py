@@ -0,0 +1,118 @@
+import asyncio
+import re
+
+from time import monotonic
+from typing import Dict, List, Optional, Pattern, Tuple
+
+from .types import RateLimitGroups
+
+# group -> (requests per second, burst)
+DEFAULT_LIMITS: Dict[str, Tuple[float, int]] = {
+    RateLimitGroups.CHAT_SEND:  (2, 5),
+    RateLimitGroups.FOLLOW:     (0.5, 3),
+    RateLimitGroups.COMMENT:    (0.5, 3),
+    RateLimitGroups.MODERATION: (1, 5),
+    RateLimitGroups.DEFAULT:    (10, 20)
+}
+
+# Checked in order against the path (without the ndc prefix),
+# reads always fall into the default group.
+ROUTES: List[Tuple[str, Pattern]] = [
+    (RateLimitGroups.MODERATION, re.compile(r"/(admin|ban|unban)(\?|$)|/member/[^/?]+\?allowRejoin=|^/notice")),
+    (RateLimitGroups.CHAT_SEND,  re.compile(r"^/chat/thread/[^/]+/message(\?|$)|^/add-chat-message")),
+    (RateLimitGroups.FOLLOW,     re.compile(r"^/user-profile/[^/]+/(member|joined)(/|\?|$)")),
+    (RateLimitGroups.COMMENT,    re.compile(r"/(g-)?comment(/|\?|$)"))
+]
+
+
+class TokenBucket:
+    def __init__(self, rate: float, burst: int) -> None:
+        self.rate: float = rate
+        self.burst: int = burst
+
+        self.tokens: float = burst
+        self.updated: float = monotonic()
+
+    def reserve(self) -> float:
+        # Takes a token now, possibly going into debt, and returns how long
+        # to wait for it. Waiters are served in order, evenly spaced.
+        now = monotonic()
+
+        self.tokens = min(self.burst, self.tokens + (now - self.updated) * self.rate)
+        self.updated = now
+        self.tokens -= 1
+
+        return 0 if self.tokens >= 0 else -self.tokens / self.rate
+
+    def refund(self) -> None:
+        self.tokens += 1
+
+    async def acquire(self) -> float:
+        if (delay := self.reserve()) > 0:
+            try:
+                await asyncio.sleep(delay)
+            except asyncio.CancelledError:
+                self.refund()
+                raise
+        return delay
+
+
+class RateLimitStats:
+    def __init__(self) -> None:
+        self.requests: int = 0
+        self.delayed: int = 0
+        self.waiting: int = 0
+        self.total_wait: float = 0
+        self.max_wait: float = 0
+
+    @property
+    def average_wait(self) -> float:
+        return self.total_wait / self.requests if self.requests else 0
+
+    def __repr__(self) -> str:
+        return (f"RateLimitStats(requests={self.requests}, delayed={self.delayed}, "
+                f"waiting={self.waiting}, average_wait={self.average_wait:.3f}, max_wait={self.max_wait:.3f})")
+
+
+class RateLimiter:
+    def __init__(self, limits: Optional[Dict[str, Tuple[float, int]]] = None) -> None:
+        self.limits: Dict[str, Tuple[float, int]] = {**DEFAULT_LIMITS, **(limits or {})}
+
+        self.buckets: Dict[Tuple[Optional[str], Optional[str], str], TokenBucket] = {}
+        self.stats: Dict[str, RateLimitStats] = {group: RateLimitStats() for group in self.limits}
+
+    @staticmethod
+    def group(method: str, path: str) -> str:
+        if method == "GET":
+            return RateLimitGroups.DEFAULT
+
+        for group, pattern in ROUTES:
+            if pattern.search(path):
+                return group
+        return RateLimitGroups.DEFAULT
+
+    def bucket(self, account: Optional[str], proxy: Optional[str], group: str) -> TokenBucket:
+        key = (account, proxy, group)
+
+        if (bucket := self.buckets.get(key)) is None:
+            bucket = self.buckets[key] = TokenBucket(*self.limits[group])
+        return bucket
+
+    async def acquire(self, account: Optional[str], proxy: Optional[str], method: str, path: str) -> float:
+        group = self.group(method, path)
+        stats = self.stats.setdefault(group, RateLimitStats())
+
+        stats.waiting += 1
+
+        try:
+            waited = await self.bucket(account, proxy, group).acquire()
+        finally:
+            stats.waiting -= 1
+
+        stats.requests += 1
+        stats.total_wait += waited
+        stats.max_wait = max(stats.max_wait, waited)
+
+        if waited:
+            stats.delayed += 1
+        return waited
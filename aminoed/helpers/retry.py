@@ -0,0 +1,96 @@
+import asyncio
+
+from random import uniform
+from typing import Any, Awaitable, Callable, FrozenSet, Iterable, Tuple, Type
+
+from aiohttp import ClientError
+
+from .exceptions import AccountLimitReached, HtmlError, ServiceUnderMaintenance, TooManyRequests
+
+# 219 is raised as AccountLimitReached by CheckException.
+RETRYABLE_CODES: FrozenSet[int] = frozenset((111, 219))
+RETRYABLE_EXCEPTIONS: Tuple[Type[BaseException], ...] = (
+    TooManyRequests, AccountLimitReached, ServiceUnderMaintenance,
+    HtmlError, ClientError, asyncio.TimeoutError
+)
+
+
+class RetryBudget:
+    def __init__(self, max_tokens: float = 10, ratio: float = 0.1) -> None:
+        # Every retry spends a token and every success earns `ratio` back,
+        # so during an outage retries stop at roughly `ratio` of the traffic.
+        self.max_tokens: float = max_tokens
+        self.ratio: float = ratio
+        self.tokens: float = max_tokens
+
+    def withdraw(self) -> bool:
+        if self.tokens < 1:
+            return False
+
+        self.tokens -= 1
+        return True
+
+    def deposit(self) -> None:
+        self.tokens = min(self.max_tokens, self.tokens + self.ratio)
+
+
+class RetryPolicy:
+    def __init__(
+        self,
+        attempts: int = 3,
+        base_delay: float = 0.5,
+        max_delay: float = 10,
+        methods: Iterable[str] = ("GET",),
+        codes: Iterable[int] = RETRYABLE_CODES,
+        exceptions: Tuple[Type[BaseException], ...] = RETRYABLE_EXCEPTIONS,
+        budget: RetryBudget = None
+    ) -> None:
+        self.attempts: int = max(attempts, 1)
+        self.base_delay: float = base_delay
+        self.max_delay: float = max_delay
+
+        self.methods: FrozenSet[str] = frozenset(method.upper() for method in methods)
+        self.codes: FrozenSet[int] = frozenset(codes)
+        self.exceptions: Tuple[Type[BaseException], ...] = exceptions
+
+        # Shared by every client using this policy.
+        self.budget: RetryBudget = budget or RetryBudget()
+
+        self.retries: int = 0
+        self.exhausted: int = 0
+
+    def retryable(self, error: BaseException) -> bool:
+        if isinstance(error, self.exceptions):
+            return True
+
+        data = error.args[0] if error.args else None
+        return isinstance(data, dict) and data.get("api:statuscode") in self.codes
+
+    def backoff(self, attempt: int) -> float:
+        # Full jitter: uniform in [0, min(max_delay, base_delay * 2 ** attempt)].
+        return uniform(0, min(self.max_delay, self.base_delay * 2 ** attempt))
+
+    async def run(self, method: str, call: Callable[[], Awaitable[Any]]) -> Any:
+        if method.upper() not in self.methods:
+            return await call()
+
+        attempt = 0
+
+        while True:
+            try:
+                result = await call()
+            except Exception as e:
+                if not self.retryable(e) or attempt + 1 >= self.attempts:
+                    raise
+
+                if not self.budget.withdraw():
+                    self.exhausted += 1
+                    raise
+
+                self.retries += 1
+                await asyncio.sleep(self.backoff(attempt))
+
+                attempt += 1
+            else:
+                self.budget.deposit()
+                return result
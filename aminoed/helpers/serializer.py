@@ -0,0 +1,75 @@
+import json
+
+from typing import Any, Callable, Dict, Union
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    import ujson
+except ImportError:
+    ujson = None
+
+
+class Serializer:
+    def __init__(
+        self,
+        name: str,
+        dumps: Callable[[Any], bytes],
+        loads: Callable[[Union[str, bytes]], Any]
+    ) -> None:
+        self.name: str = name
+        self.dumps: Callable[[Any], bytes] = dumps
+        self.loads: Callable[[Union[str, bytes]], Any] = loads
+
+    def __repr__(self) -> str:
+        return f"Serializer({self.name!r})"
+
+
+# All backends emit compact UTF-8 bytes, the same bytes are sent and signed.
+SERIALIZERS: Dict[str, Serializer] = {
+    "json": Serializer(
+        "json",
+        lambda obj: json.dumps(obj, separators=(",", ":"), ensure_ascii=False).encode("utf-8"),
+        json.loads
+    )
+}
+
+if ujson is not None:
+    SERIALIZERS["ujson"] = Serializer(
+        "ujson",
+        lambda obj: ujson.dumps(obj, ensure_ascii=False, escape_forward_slashes=False).encode("utf-8"),
+        ujson.loads
+    )
+
+if orjson is not None:
+    SERIALIZERS["orjson"] = Serializer("orjson", orjson.dumps, orjson.loads)
+
+serializer: Serializer = SERIALIZERS.get("orjson") or SERIALIZERS.get("ujson") or SERIALIZERS["json"]
+
+
+def set_serializer(name: str) -> Serializer:
+    global serializer
+
+    if name not in SERIALIZERS:
+        raise Exception(f"Unknown or not installed serializer: {name}")
+
+    serializer = SERIALIZERS[name]
+    return serializer
+
+
+def dumps(obj: Any) -> bytes:
+    return serializer.dumps(obj)
+
+
+def loads(data: Union[str, bytes]) -> Any:
+    return serializer.loads(data)
+
+
+def clone(obj: Any) -> Any:
+    # Deep copy of a parsed JSON response, a round trip beats deepcopy.
+    if isinstance(obj, (dict, list)):
+        return serializer.loads(serializer.dumps(obj))
+    return obj
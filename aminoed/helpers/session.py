@@ -0,0 +1,135 @@
+import asyncio
+
+from contextlib import suppress
+from time import time
+from typing import Any, Optional, Tuple
+
+from ..http import HttpClient
+from .models import Auth
+from .types import GLOBAL_ID
+from .utils import cache_lock, decode_sid, get_cache, set_cache
+
+SID_LIFETIME = 43200
+
+
+class SessionManager:
+    def __init__(
+        self,
+        client: Any,
+        email: Optional[str] = None,
+        password: Optional[str] = None,
+        phone_number: Optional[str] = None,
+        margin: float = 1800,
+        retry_delay: float = 60
+    ) -> None:
+        self.client = client
+        self.email: Optional[str] = email
+        self.password: Optional[str] = password
+        self.phone_number: Optional[str] = phone_number
+
+        self.margin: float = margin
+        self.retry_delay: float = retry_delay
+
+        self.refreshes: int = 0
+        self.failures: int = 0
+
+        self._task: Optional[asyncio.Task] = None
+        self._refreshing: Optional[asyncio.Future] = None
+        self._failed_at: float = 0
+        self._expires: Tuple[Optional[str], float] = (None, 0)
+
+    @property
+    def expires_at(self) -> float:
+        # Decoded once per sid, this is checked before every request.
+        if not (sid := self.client.auth.sid):
+            return 0
+
+        if self._expires[0] != sid:
+            self._expires = (sid, decode_sid(sid).makeTime + SID_LIFETIME)
+        return self._expires[1]
+
+    @property
+    def refresh_at(self) -> float:
+        return self.expires_at - self.margin
+
+    async def login(self) -> Auth:
+        # Logs in on a throwaway client so the live one never holds a
+        # half-updated Auth, then swaps it in with a single set_auth.
+        client = self.client
+        http = HttpClient(GLOBAL_ID, client._session, client.proxy, client.proxy_auth)
+        http.device_id = client.device_id
+
+        if self.password is not None:
+            secret = f"0 {self.password}"
+        elif client.auth.secret:
+            secret = client.auth.secret
+        else:
+            raise Exception("Session refresh needs a password or an Auth with a secret.")
+
+        if self.email is None:
+            return await http.base_login(self.email, secret, client.device_id, self.phone_number)
+
+        async with cache_lock(self.email):
+            # Another process may have refreshed this account already.
+            if (cached := await get_cache(self.email)) and cached.get("sid") != client.auth.sid:
+                with suppress(Exception):
+                    if decode_sid(cached["sid"]).makeTime + SID_LIFETIME - self.margin > time():
+                        return Auth(**cached)
+
+            auth = await http.base_login(self.email, secret, client.device_id, self.phone_number)
+            await set_cache(self.email, auth.dict())
+
+        return auth
+
+    async def _swap(self) -> Auth:
+        try:
+            auth = await self.login()
+        except Exception:
+            self.failures += 1
+            self._failed_at = time()
+            raise
+
+        self.client.set_auth(auth)
+        self.refreshes += 1
+
+        return auth
+
+    async def refresh(self) -> Auth:
+        # Concurrent callers share one login, the swap happens once.
+        if self._refreshing is None:
+            self._refreshing = asyncio.ensure_future(self._swap())
+            self._refreshing.add_done_callback(lambda _: setattr(self, "_refreshing", None))
+
+        return await asyncio.shield(self._refreshing)
+
+    async def ensure_fresh(self) -> None:
+        # Called before every request, after a failed login the current
+        # sid is used until retry_delay passes instead of blocking on it.
+        # A failed refresh only fails the request once the sid has expired.
+        if time() >= self.refresh_at and time() - self._failed_at >= self.retry_delay:
+            try:
+                await self.refresh()
+            except Exception:
+                if time() >= self.expires_at:
+                    raise
+
+    async def run(self) -> None:
+        while True:
+            await asyncio.sleep(max(self.refresh_at - time(), 0))
+
+            try:
+                await self.refresh()
+            except Exception as e:
+                print(f"Session refresh failed: {e}")
+
+                await asyncio.sleep(self.retry_delay)
+
+    def start(self) -> asyncio.Task:
+        if self._task is None or self._task.done():
+            self._task = self.client.loop.create_task(self.run())
+        return self._task
+
+    def stop(self) -> None:
+        if self._task is not None:
+            self._task.cancel()
+            self._task = None
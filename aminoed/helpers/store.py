@@ -0,0 +1,304 @@
+import asyncio
+import os
+import sqlite3
+import threading
+
+from contextlib import asynccontextmanager
+from time import time
+from typing import Any, AsyncIterator, Dict, Iterator, Optional, Tuple
+from uuid import uuid4
+
+from .serializer import dumps, loads
+
+
+class CredentialStore:
+    def __init__(self) -> None:
+        # key -> (owner, expires), only seen by this process.
+        self._leases: Dict[str, Tuple[str, float]] = {}
+        self._leases_lock: threading.Lock = threading.Lock()
+
+    def get(self, key: str, default: Any = None) -> Any:
+        raise NotImplementedError
+
+    def put(self, key: str, value: Any) -> None:
+        raise NotImplementedError
+
+    def delete(self, key: str) -> None:
+        raise NotImplementedError
+
+    def keys(self) -> Iterator[str]:
+        raise NotImplementedError
+
+    def compact(self) -> None:
+        pass
+
+    def close(self) -> None:
+        pass
+
+    def try_lock(self, key: str, owner: str, ttl: float) -> bool:
+        # Called from executor threads, see lock().
+        with self._leases_lock:
+            if (lease := self._leases.get(key)) is not None and lease[1] > time():
+                return False
+
+            self._leases[key] = (owner, time() + ttl)
+            return True
+
+    def unlock(self, key: str, owner: str) -> None:
+        with self._leases_lock:
+            if (lease := self._leases.get(key)) is not None and lease[0] == owner:
+                del self._leases[key]
+
+    @asynccontextmanager
+    async def lock(self, key: str, ttl: float = 60, timeout: float = 120, poll: float = 0.2) -> AsyncIterator[None]:
+        # A lease rather than a held lock: a crashed holder blocks the
+        # key for at most ttl seconds.
+        owner = f"{os.getpid()}:{uuid4()}"
+        deadline = time() + timeout
+
+        loop = asyncio.get_running_loop()
+
+        while not await loop.run_in_executor(None, self.try_lock, key, owner, ttl):
+            if time() >= deadline:
+                raise Exception(f"Timed out waiting for the lock on {key}.")
+            await asyncio.sleep(poll)
+
+        try:
+            yield
+        finally:
+            await loop.run_in_executor(None, self.unlock, key, owner)
+
+    def __contains__(self, key: str) -> bool:
+        return self.get(key) is not None
+
+    def __len__(self) -> int:
+        return sum(1 for _ in self.keys())
+
+    def migrate(self, path: str = ".ed.json") -> int:
+        # Imports the old whole-file cache once, then moves it aside.
+        try:
+            with open(path, "rb") as file:
+                data = loads(file.read())
+        except (OSError, ValueError):
+            return 0
+
+        for key, value in data.items():
+            if key not in self:
+                self.put(key, value)
+
+        # Workers starting together all import it, only one gets to move it.
+        try:
+            os.replace(path, path + ".migrated")
+        except FileNotFoundError:
+            pass
+        
+        return len(data)
+
+
+class MemoryStore(CredentialStore):
+    def __init__(self) -> None:
+        super().__init__()
+        self._data: Dict[str, Any] = {}
+
+    def get(self, key: str, default: Any = None) -> Any:
+        return self._data.get(key, default)
+
+    def put(self, key: str, value: Any) -> None:
+        self._data[key] = value
+
+    def delete(self, key: str) -> None:
+        self._data.pop(key, None)
+
+    def keys(self) -> Iterator[str]:
+        return iter(list(self._data))
+
+
+class SQLiteStore(CredentialStore):
+    def __init__(self, path: str = ".ed.db", busy_timeout: float = 10) -> None:
+        # Safe to share between processes: WAL lets readers run next to
+        # the single writer and busy_timeout queues concurrent writers.
+        super().__init__()
+
+        self.path: str = path
+        self._lock: threading.Lock = threading.Lock()
+
+        self._connection: sqlite3.Connection = sqlite3.connect(
+            path, timeout=busy_timeout, isolation_level=None, check_same_thread=False)
+
+        self._connection.execute("PRAGMA journal_mode=WAL")
+        self._connection.execute("PRAGMA synchronous=NORMAL")
+        self._connection.execute(
+            "CREATE TABLE IF NOT EXISTS credentials (key TEXT PRIMARY KEY, value BLOB NOT NULL)")
+        self._connection.execute(
+            "CREATE TABLE IF NOT EXISTS locks (key TEXT PRIMARY KEY, owner TEXT NOT NULL, expires REAL NOT NULL)")
+
+    def get(self, key: str, default: Any = None) -> Any:
+        with self._lock:
+            row = self._connection.execute(
+                "SELECT value FROM credentials WHERE key = ?", (key,)).fetchone()
+        return default if row is None else loads(row[0])
+
+    def put(self, key: str, value: Any) -> None:
+        with self._lock:
+            self._connection.execute(
+                "INSERT INTO credentials (key, value) VALUES (?, ?) "
+                "ON CONFLICT(key) DO UPDATE SET value = excluded.value", (key, dumps(value)))
+
+    def delete(self, key: str) -> None:
+        with self._lock:
+            self._connection.execute("DELETE FROM credentials WHERE key = ?", (key,))
+
+    def keys(self) -> Iterator[str]:
+        with self._lock:
+            rows = self._connection.execute("SELECT key FROM credentials").fetchall()
+        return iter([row[0] for row in rows])
+
+    def __len__(self) -> int:
+        with self._lock:
+            return self._connection.execute("SELECT COUNT(*) FROM credentials").fetchone()[0]
+
+    def try_lock(self, key: str, owner: str, ttl: float) -> bool:
+        now = time()
+
+        with self._lock:
+            cursor = self._connection.execute(
+                "INSERT INTO locks (key, owner, expires) VALUES (?, ?, ?) "
+                "ON CONFLICT(key) DO UPDATE SET owner = excluded.owner, expires = excluded.expires "
+                "WHERE locks.expires < ?", (key, owner, now + ttl, now))
+        return cursor.rowcount == 1
+
+    def unlock(self, key: str, owner: str) -> None:
+        with self._lock:
+            self._connection.execute("DELETE FROM locks WHERE key = ? AND owner = ?", (key, owner))
+
+    def compact(self) -> None:
+        with self._lock:
+            self._connection.execute("PRAGMA wal_checkpoint(TRUNCATE)")
+            self._connection.execute("VACUUM")
+
+    def close(self) -> None:
+        with self._lock:
+            self._connection.close()
+
+
+class LogStore(CredentialStore):
+    def __init__(self, path: str = ".ed.log", compact_ratio: float = 2) -> None:
+        # One JSON record per line, later records win. A torn last line
+        # (crash mid-write) is skipped on load. Single process only,
+        # use SQLiteStore to share credentials between workers.
+        super().__init__()
+
+        self.path: str = path
+        self.compact_ratio: float = compact_ratio
+
+        self._lock: threading.RLock = threading.RLock()
+        self._data: Dict[str, Any] = {}
+        self._records: int = 0
+
+        self._load()
+        self._file = open(path, "ab")
+
+    def _load(self) -> None:
+        try:
+            with open(self.path, "rb") as file:
+                content = file.read()
+        except FileNotFoundError:
+            return
+
+        for line in content.splitlines():
+            try:
+                record = loads(line)
+            except ValueError:
+                continue
+
+            self._records += 1
+
+            if record.get("deleted"):
+                self._data.pop(record["key"], None)
+            else:
+                self._data[record["key"]] = record["value"]
+
+        # Cut a torn tail so the next record starts on its own line.
+        if content and not content.endswith(b"\n"):
+            with open(self.path, "r+b") as file:
+                file.truncate(content.rfind(b"\n") + 1)
+
+    def _append(self, record: Dict) -> None:
+        self._file.write(dumps(record) + b"\n")
+        self._file.flush()
+        os.fsync(self._file.fileno())
+
+        self._records += 1
+
+    def _maybe_compact(self) -> None:
+        if self._records > 1000 and self._records > len(self._data) * self.compact_ratio:
+            self.compact()
+
+    def get(self, key: str, default: Any = None) -> Any:
+        return self._data.get(key, default)
+
+    def put(self, key: str, value: Any) -> None:
+        with self._lock:
+            self._append({"key": key, "value": value})
+            self._data[key] = value
+            self._maybe_compact()
+
+    def delete(self, key: str) -> None:
+        with self._lock:
+            if key in self._data:
+                self._append({"key": key, "deleted": True})
+                del self._data[key]
+                self._maybe_compact()
+
+    def keys(self) -> Iterator[str]:
+        return iter(list(self._data))
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+    def compact(self) -> None:
+        # Rewrites the live records to a temporary file and swaps it in.
+        with self._lock:
+            temp = self.path + ".tmp"
+
+            with open(temp, "wb") as file:
+                for key, value in self._data.items():
+                    file.write(dumps({"key": key, "value": value}) + b"\n")
+
+                file.flush()
+                os.fsync(file.fileno())
+
+            self._file.close()
+            os.replace(temp, self.path)
+
+            self._file = open(self.path, "ab")
+            self._records = len(self._data)
+
+    def close(self) -> None:
+        with self._lock:
+            self._file.close()
+
+
+STORE: Optional[CredentialStore] = None
+STORE_LOCK: threading.Lock = threading.Lock()
+
+
+def get_store() -> CredentialStore:
+    # Also called from executor threads, the default store is opened once.
+    global STORE
+
+    if STORE is None:
+        with STORE_LOCK:
+            if STORE is None:
+                store = SQLiteStore()
+                store.migrate()
+                STORE = store
+    return STORE
+
+
+def set_store(store: CredentialStore) -> CredentialStore:
+    global STORE
+
+    with STORE_LOCK:
+        STORE = store
+    return STORE
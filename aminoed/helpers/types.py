@@ -288,6 +288,18 @@ class PathTypes:
     
     LEFT_SIDE_PANEL_ICON_COLOR = "appearance.leftSidePanel.style.iconColor"   
     
+class BackpressureTypes:
+    BLOCK: str =       "block"
+    DROP_OLDEST: str = "drop-oldest"
+    DROP_NEWEST: str = "drop-newest"
+    
+class RateLimitGroups:
+    CHAT_SEND: str =  "chat-send"
+    FOLLOW: str =     "follow"
+    COMMENT: str =    "comment"
+    MODERATION: str = "moderation"
+    DEFAULT: str =    "default"
+    
 class Language:
     RU: str = "ru-UA"
     ENG: str = "en-US" 
@@ -303,3 +315,6 @@ def allTypes(self: classmethod):
     normal_values.extend([value[1] for value in values 
                           if isinstance(value[1], int) or isinstance(value[1], str)])
     return normal_values
+
+
+EVENT_TYPES: frozenset = frozenset(allTypes(EventTypes))
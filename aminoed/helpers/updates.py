@@ -0,0 +1,77 @@
+import asyncio
+import os
+import threading
+
+from time import time
+from typing import Optional
+
+from aiohttp import ClientSession, ClientTimeout
+
+from .serializer import dumps, loads
+
+PYPI_URL = "https://pypi.org/pypi/{0}/json"
+CACHE_PATH = os.path.join(os.path.expanduser("~"), ".cache", "aminoed", "version.json")
+CACHE_TTL = 86400
+
+UPDATE_CHECKED = False
+UPDATE_TASK: Optional[asyncio.Task] = None
+
+
+def cached_version(path: str = CACHE_PATH) -> Optional[str]:
+    try:
+        with open(path, "rb") as file:
+            data = loads(file.read())
+    except (OSError, ValueError):
+        return None
+
+    if time() - data.get("checked", 0) < CACHE_TTL:
+        return data.get("version")
+
+
+def save_version(version: str, path: str = CACHE_PATH) -> None:
+    try:
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+
+        with open(path + ".tmp", "wb") as file:
+            file.write(dumps({"checked": time(), "version": version}))
+
+        os.replace(path + ".tmp", path)
+    except OSError:
+        pass
+
+
+async def newest_version(title: str, timeout: float = 5) -> Optional[str]:
+    if (version := cached_version()) is not None:
+        return version
+
+    try:
+        async with ClientSession(timeout=ClientTimeout(total=timeout)) as session:
+            async with session.get(PYPI_URL.format(title)) as response:
+                version = (await response.json(loads=loads)).get("info", {}).get("version")
+    except Exception:
+        return None  # offline or PyPI unavailable, try again next run
+
+    if version:
+        save_version(version)
+    return version
+
+
+async def check_updates(title: str, version: str) -> None:
+    if (newest := await newest_version(title)) and newest != version:
+        print(f"New version available: {newest} (Using {version})")
+
+
+def schedule_update_check(title: str, version: str) -> None:
+    # Once per process, never blocks the caller: a task on the running
+    # loop, or a daemon thread with its own loop when none is running.
+    global UPDATE_CHECKED, UPDATE_TASK
+
+    if UPDATE_CHECKED:
+        return
+
+    UPDATE_CHECKED = True
+
+    try:
+        UPDATE_TASK = asyncio.get_running_loop().create_task(check_updates(title, version))
+    except RuntimeError:
+        threading.Thread(target=asyncio.run, args=(check_updates(title, version),), daemon=True).start()
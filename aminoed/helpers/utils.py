@@ -3,44 +3,56 @@ import hmac
 import os
 import json
 
+from contextlib import contextmanager
+from contextvars import ContextVar
 from hashlib import sha1
 from time import time
-from typing import Any, Dict, List, Union
-from aiofile import async_open
+from typing import TYPE_CHECKING, Any, Awaitable, Callable, Dict, Iterable, List, Union
 from base64 import urlsafe_b64decode, b64encode, urlsafe_b64encode
 
-from .models import SID
+from .store import get_store
+
+if TYPE_CHECKING:
+    from .models import SID
 
 PREFIX = bytes.fromhex("19")
 SIG_KEY = bytes.fromhex("DFA5ED192DDA6E88A12FE12130DC6206B1251E44")
 DEVICE_KEY = bytes.fromhex("E7309ECC0953C6FA60005B2765F99DBBC965C8E9")
 
-try:
-    with open(".ed.json") as file:
-        CACHE = json.loads(file.read())
-except ValueError:
-    CACHE = {}
-except FileNotFoundError:
-    CACHE = {}
-except FileExistsError:
-    CACHE = {}
+# Keyed once, every call copies the state instead of re-deriving the pads.
+SIG_HMAC = hmac.new(SIG_KEY, digestmod=sha1)
+DEVICE_HMAC = hmac.new(DEVICE_KEY, PREFIX, sha1)
+
+# Entries saved with is_temp, kept for this process only.
+TEMP_CACHE: Dict[str, Any] = {}
 
-CACHE_LOCK = asyncio.Lock()
+RAW_RESPONSES: ContextVar = ContextVar("raw_responses", default=False)
 
 
 def generate_device(data: bytes = None) -> str:
     identifier = data or os.urandom(20)
-    mac = hmac.new(DEVICE_KEY, PREFIX + identifier, sha1)
+    mac = DEVICE_HMAC.copy()
+    mac.update(identifier)
     return f"{PREFIX.hex()}{identifier.hex()}{mac.hexdigest()}".upper()
 
 
+def generate_devices(count: int) -> List[str]:
+    entropy = os.urandom(20 * count)
+    return [generate_device(entropy[index:index + 20]) for index in range(0, 20 * count, 20)]
+
+
 def update_device(deviceId: str) -> str:
     return generate_device(bytes.fromhex(deviceId[2:42]))
 
 
 def generate_signature(data: Union[str, bytes]) -> str:
-    data = data if isinstance(data, bytes) else data.encode("utf-8")
-    return b64encode(PREFIX + hmac.new(SIG_KEY, data, sha1).digest()).decode("utf-8")
+    mac = SIG_HMAC.copy()
+    mac.update(data if isinstance(data, bytes) else data.encode("utf-8"))
+    return b64encode(PREFIX + mac.digest()).decode("utf-8")
+
+
+def generate_signatures(bodies: Iterable[Union[str, bytes]]) -> List[str]:
+    return [generate_signature(data) for data in bodies]
 
 
 def get_timers(size: int) -> List[Dict[str, int]]:
@@ -63,7 +75,10 @@ def generate_sid(key: str, userId: str, ip: str, timestamp: int = int(time()), c
     return urlsafe_b64encode(identifier + mac.digest()).decode().replace("=", "")
 
 
-def decode_sid(sid: str) -> SID:
+def decode_sid(sid: str) -> 'SID':
+    # Imported here so the helpers don't pull in every model at import time.
+    from .models import SID
+    
     fixed_sid = sid + "=" * (4 - len(sid) % 4)
     uncoded_sid = urlsafe_b64decode(fixed_sid)
     
@@ -79,7 +94,7 @@ def decode_sid(sid: str) -> SID:
     )
     
     
-def decode_secret(secret: str) -> SID:
+def decode_secret(secret: str) -> 'SID':
     info = secret.split()
     
     info[0] = int(info[0])
@@ -105,24 +120,34 @@ def is_json(myjson) -> bool:
     return True
 
 
+def run_blocking(func: Callable, *args: Any) -> Awaitable:
+    # Store calls fsync or wait on other processes, keep them off the loop.
+    return asyncio.get_running_loop().run_in_executor(None, func, *args)
+
+
 async def set_cache(key: str, value: Any, is_temp: bool = False) -> Any:
-    global CACHE
+    if is_temp:
+        TEMP_CACHE[key] = value
+        return
     
-    async with CACHE_LOCK:    
-        CACHE.update({key: value})
-        
-        if is_temp:
-            return
-        
-        async with async_open(".ed.json", "w") as file:
-            await file.write(json.dumps(CACHE))
+    TEMP_CACHE.pop(key, None)
+    await run_blocking(lambda: get_store().put(key, value))
 
 
 async def get_cache(key: str, default: Any = None) -> Any:
-    global CACHE
-    
-    async with CACHE_LOCK:    
-        return CACHE.get(key, default)
+    if key in TEMP_CACHE:
+        return TEMP_CACHE[key]
+    return await run_blocking(lambda: get_store().get(key, default))
+
+
+def cache_lock(key: str, ttl: float = 60):
+    # Per-key lock shared by every process using the same store.
+    return get_store().lock(key, ttl)
+
+
+async def drop_cache(key: str) -> None:
+    TEMP_CACHE.pop(key, None)
+    await run_blocking(lambda: get_store().delete(key))
 
 
 def properties(objects: list, name: str):
@@ -136,6 +161,17 @@ def list_to_lists(list: list, values_per_list: int):
 def jsonify(**kwargs) -> Dict:
     return kwargs
 
+
+@contextmanager
+def raw_responses(enabled: bool = True):
+    token = RAW_RESPONSES.set(enabled)
+    
+    try:
+        yield
+    finally:
+        RAW_RESPONSES.reset(token)
+
+
 def get_event_loop() -> asyncio.AbstractEventLoop:
     try:
         loop = asyncio.get_running_loop()  
@@ -1,4 +1,7 @@
+import asyncio
 import json
+import os
+import signal
 import sys
 
 from random import randint
@@ -6,15 +9,21 @@ from uuid import uuid4
 from time import time
 from locale import localeconv
 from base64 import b64encode
-from typing import Dict, List, Optional, Union
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Type, Union
 
 from aiohttp import BaseConnector, BasicAuth, ClientSession, ClientTimeout, ContentTypeError
-from json_minify import json_minify
 
 from .helpers.models import *
 
 from .helpers.types import GLOBAL_ID, ChatPublishTypes, ContentTypes, FeaturedTypes, Language, ObjectTypes, PathTypes, PostTypes, RepairTypes, SourceTypes, UserTypes
-from .helpers.utils import generate_signature, generate_device, get_ndc, jsonify, update_device
+from .helpers.utils import RAW_RESPONSES, generate_signature, generate_device, get_ndc, jsonify, update_device
+from .helpers.pool import ConnectionPool
+from .helpers.cache import ResponseCache, SingleFlight
+from .helpers.paginator import PageCursor, Paginator
+from .helpers.identity import IdentityMap
+from .helpers.ratelimit import RateLimiter
+from .helpers.retry import RetryPolicy
+from .helpers.serializer import dumps, loads
 from .helpers.exceptions import CheckException, IpTomporaryBan, SpecifyType, HtmlError
 
 
@@ -30,8 +39,7 @@ class WebHttpClient:
         debug: bool = False
     ) -> None:
         self.connector: Optional[BaseConnector] = connector
-        self.session: ClientSession = session or ClientSession()
-        self.debug = debug
+        self._session: Optional[ClientSession] = session
         self.debug = debug
         
         self.sid: Optional[str] = sid
@@ -40,12 +48,23 @@ class WebHttpClient:
         user_agent = "Amino.ed Python/{0[0]}.{0[1]} Bot"
         self.user_agent: str = user_agent.format(sys.version_info)
     
+    @property
+    def session(self) -> ClientSession:
+        if not self._session or self._session.closed:
+            return HttpClient.pool.session
+        return self._session
+    
+    @session.setter
+    def session(self, session: ClientSession) -> None:
+        self._session = session
+    
     @property
     def referer(self):
         return f"{self.URL}/partial/main-chat-window?ndcId={self.ndc_id}"
         
     async def request(self, method: str, path: str, **kwargs):
         url = f"{self.URL}api{path}"
+        data = None
 
         headers: Dict[str, str] = {
             "User-Agent": self.user_agent,
@@ -61,33 +80,30 @@ class WebHttpClient:
             data = kwargs.pop("json")
             data["ndcId"] = get_ndc(self.ndc_id)[1:-2]
 
-            kwargs["data"] = json.dumps(data)
+            kwargs["data"] = data = dumps(data)
         
         kwargs["headers"] = headers
         response_json: Optional[Dict] = None
 
         async with self.session.request(method, url, **kwargs) as response:
             try:
-                response_json: Dict = await response.json(loads=json.loads)
+                response_json: Dict = await response.json(loads=loads)
             except ContentTypeError:
                 response_text = await response.text()
                 raise HtmlError(response_text)
             
             if self.debug:
                 message = f"\n\n<---REQUEST {url} START--->\n\n"
-                message += json.dumps(headers) + "\n"
+                message += dumps(headers).decode() + "\n"
                 
                 if data is not None:
-                    message += data + "\n"
+                    message += (data.decode() if isinstance(data, bytes) else str(data)) + "\n"
             
-                message += f"\n{response.status} {json.dumps(response_json)}\n\n"
+                message += f"\n{response.status} {dumps(response_json).decode()}\n\n"
                 message += f"<---REQUEST {url} END--->\n\n"
                 print(message, end="")
 
             if response.status != 200:
-                if not self.session.closed:
-                    await self.session.close()
-
                 return CheckException(response_json)
             
             print(response.status, response_json)
@@ -156,7 +172,9 @@ class WebHttpClient:
 class HttpClient:
     URL: str = "https://service.aminoapps.com/"
     LANGUAGE: str = Language.ENG
-    _session: ClientSession = ClientSession()
+    pool: ConnectionPool = ConnectionPool()
+    # Identical concurrent GETs share one network call, None disables it.
+    single_flight: Optional[SingleFlight] = SingleFlight()
 
     def __init__(
         self,
@@ -169,7 +187,7 @@ class HttpClient:
         debug: bool = False
     ) -> None:
         self.connector: Optional[BaseConnector] = connector
-        self._session: Optional[ClientSession] = session or self._session
+        self._session: Optional[ClientSession] = session
         self.debug = debug
 
         self.ndc_id: int = GLOBAL_ID
@@ -186,13 +204,75 @@ class HttpClient:
 
         self.user_agent: str = "Apple iPhone12,1 iOS v15.5 Main/3.12.2"
         
+        # Return parsed JSON dicts instead of models,
+        # see also raw_responses() for a single call.
+        self.raw: bool = False
+        # Build nested models on first attribute access.
+        self.lazy: bool = False
+        # Share one UserProfile per (ndcId, uid) across responses.
+        self.identity_map: Optional[IdentityMap] = None
+        # Throttle requests per account, proxy and endpoint group.
+        self.rate_limiter: Optional[RateLimiter] = None
+        # Retry failed requests (GETs by default) with backoff.
+        self.retry_policy: Optional[RetryPolicy] = None
+        # Cache read-mostly responses, writes invalidate related entries.
+        self.cache: Optional[ResponseCache] = None
+        
     async def request(self, method: str, path: str, **kwargs):
+        if (cache := self.cache) is None:
+            return await self._coalesce(method, path, **kwargs)
+        
+        ndc_id = abs(kwargs.get("ndc_id", self.ndc_id))
+        
+        if (ttl := cache.ttl(method, path)) is None:
+            if method == "GET":
+                return await self._coalesce(method, path, **kwargs)
+            
+            try:
+                return await self._coalesce(method, path, **kwargs)
+            finally:
+                cache.invalidate(path, ndc_id)
+        
+        body = kwargs.get("json")
+        key = (ndc_id, path, self.auth.sid, None if body is None else dumps(body))
+        
+        if (response := cache.get(key)) is not None:
+            return response
+        
+        response = await self._coalesce(method, path, **kwargs)
+        cache.set(key, response, ttl)
+        
+        return response
+    
+    async def _coalesce(self, method: str, path: str, **kwargs):
+        if self.single_flight is None or method != "GET" or kwargs.get("data") is not None:
+            return await self._retry(method, path, **kwargs)
+
+        key = (
+            asyncio.get_running_loop(),
+            get_ndc(kwargs.get("ndc_id", self.ndc_id)) + path,
+            self.auth.sid,
+            kwargs.get("proxy") or self.proxy
+        )
+
+        return await self.single_flight.do(key, lambda: self._retry(method, path, **kwargs))
+    
+    async def _retry(self, method: str, path: str, **kwargs):
+        if self.retry_policy is None:
+            return await self._request(method, path, **kwargs)
+        return await self.retry_policy.run(method, lambda: self._request(method, path, **kwargs))
+        
+    async def _request(self, method: str, path: str, **kwargs):
         ndc_id = kwargs.pop("ndc_id", self.ndc_id)
         url = f"{self.URL}api/v1{get_ndc(ndc_id)}{path}"
             
         if kwargs.pop("full_url", None):
             url = kwargs.get("full_url", url)
 
+        if self.rate_limiter is not None:
+            await self.rate_limiter.acquire(self.auth.auid or self.device_id, 
+                                            kwargs.get("proxy") or self.proxy, method, path)
+
         headers: Dict[str, str] = {
             "User-Agent": self.user_agent,
             "NDCDEVICEID": self.device_id,
@@ -207,7 +287,7 @@ class HttpClient:
             data = kwargs.pop("json")
             data["timestamp"] = int(time() * 1000)
 
-            kwargs["data"] = json.dumps(data)
+            kwargs["data"] = dumps(data)
         
         if (data := kwargs.get("data")) is not None:
             headers["NDC-MSG-SIG"] = generate_signature(data)
@@ -220,49 +300,49 @@ class HttpClient:
 
         if kwargs.get("proxy_auth") is None:
             kwargs["proxy_auth"] = self.proxy_auth
+
+        if kwargs.get("timeout") is None:
+            kwargs["timeout"] = self.timeout
         
         kwargs["headers"] = headers
         response_json: Optional[Dict] = None
 
         async with self.session.request(method, url, **kwargs) as response:
             try:
-                response_json: Dict = await response.json(loads=json.loads)
+                response_json: Dict = await response.json(loads=loads)
             except ContentTypeError:
                 response_text = await response.text()
                 
-                if not self.session.closed:
-                    await self.session.close()
-                
                 if "403" in response_text:
                     raise IpTomporaryBan("403 Forbidden")
                 else:
-                    raise HtmlError(response_json)
+                    raise HtmlError(response_text)
                 
             if self.debug:
                 message = f"\n\n<---REQUEST {url} START--->\n\n"
-                message += json.dumps(headers) + "\n"
+                message += dumps(headers).decode() + "\n"
                 
                 if data is not None:
-                    message += data + "\n"
+                    message += (data.decode() if isinstance(data, bytes) else str(data)) + "\n"
             
-                message += f"\n{response.status} {json.dumps(response_json)}\n\n"
+                message += f"\n{response.status} {dumps(response_json).decode()}\n\n"
                 message += f"<---REQUEST {url} END--->\n\n"
                 print(message, end="")
 
             if response.status != 200:
-                if not self.session.closed:
-                    await self.session.close()
-
                 return CheckException(response_json)
             return response_json or response.status
     
     @property
     def web(self) -> WebHttpClient:
-        return WebHttpClient(self.ndc_id, self.auth.sid, self.session)
+        return WebHttpClient(self.ndc_id, self.auth.sid, self._session)
         
     @property
     def session(self) -> ClientSession:
         if not self._session or self._session.closed:
+            if not self.connector:
+                return self.pool.session
+            
             self._session = ClientSession(
                 timeout=self.timeout, connector=self.connector)
         return self._session
@@ -302,6 +382,61 @@ class HttpClient:
     def device_id(self, device_id: str):
         self._device_id = update_device(device_id)
 
+    def parse(self, model: Type[Model], data: Dict) -> Union[Model, Dict]:
+        if self.raw or RAW_RESPONSES.get():
+            return data
+        if self.identity_map is not None:
+            return self.identity_map.parse(model, data, self.lazy)
+        if self.lazy:
+            return model.lazy(**data)
+        return model(**data)
+    
+    def parse_list(self, model: Type[Model], objects: List[Dict], **extra: Any) -> List:
+        if self.raw or RAW_RESPONSES.get():
+            return [{**o, **extra} for o in objects] if extra else objects
+        if self.identity_map is not None:
+            return self.identity_map.parse_list(model, objects, self.lazy, **extra)
+        if self.lazy:
+            return [model.lazy(**o, **extra) for o in objects]
+        return [model(**o, **extra) for o in objects]
+
+    def paginate(
+        self, 
+        method: Callable[..., Awaitable[List]], 
+        *args, 
+        page_size: int = 100, 
+        max_items: Optional[int] = None, 
+        concurrency: int = 1,
+        **kwargs
+    ) -> Paginator:
+        return Paginator(method, *args, page_size=page_size, 
+                         max_items=max_items, concurrency=concurrency, **kwargs)
+
+    def chat_history(
+        self,
+        thread_id: str,
+        page_size: int = 100,
+        page_token: Optional[str] = None,
+        oldest_first: bool = False,
+        until_id: Optional[str] = None,
+        until_time: Optional[str] = None,
+        offset: int = 0
+    ) -> PageCursor:
+        return PageCursor(self.get_chat_messages, thread_id, page_size=page_size, page_token=page_token,
+                          offset=offset, oldest_first=oldest_first, until_id=until_id, until_time=until_time)
+
+    def recent_blogs(
+        self,
+        page_size: int = 100,
+        page_token: Optional[str] = None,
+        oldest_first: bool = False,
+        until_id: Optional[str] = None,
+        until_time: Optional[str] = None,
+        offset: int = 0
+    ) -> PageCursor:
+        return PageCursor(self.get_recent_blogs, page_size=page_size, page_token=page_token, offset=offset,
+                          oldest_first=oldest_first, until_id=until_id, until_time=until_time, id_field="blogId")
+
     async def base_login(
         self, 
         email: str = None, 
@@ -340,11 +475,11 @@ class HttpClient:
     
     async def get_account_info(self) -> Account:
         response = await self.request("GET", "/account", ndc_id=GLOBAL_ID)
-        return Account(**response["account"])
+        return self.parse(Account, response["account"])
     
     async def get_user_info(self, uid: str) -> UserProfile:
         response = await self.request("GET", f"/user-profile/{uid}")
-        return UserProfile(**response["userProfile"])
+        return self.parse(UserProfile, response["userProfile"])
 
     async def register(self, nickname: str, email: str,
                     password: str, code: str = None) -> Auth:
@@ -485,30 +620,30 @@ class HttpClient:
         response = await self.request("GET", "/community/info?withInfluencerList=1" \
             "&withTopicList=true&influencerListOrderStrategy=fansCount", ndc_id=-(ndc_id or self.ndc_id))
 
-        return Community(**response["community"])
+        return self.parse(Community, response["community"])
     
     async def get_account_communities(self, start: int = 0, size: int = 100) -> List[Community]:
         response = await self.request("GET", f"/community/joined?v=1&start={start}&size={size}", ndc_id=GLOBAL_ID)
-        return list(map(lambda o: Community(**o), response["communityList"])) 
+        return self.parse_list(Community, response["communityList"])
     
     async def search_community(self, amino_id: str):
         response = await self.request("GET", f"/search/amino-id-and-link?q={amino_id}", ndc_id=GLOBAL_ID)
-        return list(map(lambda o: Community(**o), [v["refObject"] for v in response["resultList"]]))
+        return self.parse_list(Community, [v["refObject"] for v in response["resultList"]])
 
     async def get_chat_thread(self, thread_id: str) -> Thread:
-        return Thread(**(await self.request("GET", f"/chat/thread/{thread_id}"))["thread"])
+        return self.parse(Thread, (await self.request("GET", f"/chat/thread/{thread_id}"))["thread"])
     
     async def get_chat_threads(self, start: int = 0, size: int = 100) -> List[Thread]:
         response = await self.request("GET",
             f"/chat/thread?type=joined-me&start={start}&size={size}")
 
-        return list(map(lambda o: Thread(**o), response["threadList"]))
+        return self.parse_list(Thread, response["threadList"])
     
     async def get_chat_users(self, thread_id: str, start: int = 0, size: int = 100) -> List[UserProfile]:
         response = await self.request("GET",
             f"/chat/thread/{thread_id}/member?start={start}&size={size}&type=default&cv=1.2")
 
-        return list(map(lambda o: UserProfile(**o), response["memberList"]))
+        return self.parse_list(UserProfile, response["memberList"])
     
     async def start_chat(self, uid: Union[str, list], message: str, title: str = None,
             content: str = None, is_global: bool = False, publish_to_global: bool = False) -> Thread:
@@ -547,48 +682,48 @@ class HttpClient:
         return await self.request("DELETE", f"/chat/thread/{thread_id}/member/{uid}?allowRejoin={0 if allow_rejoin else 1}")
     
     async def get_message_info(self, thread_id: str, message_id: str):
-        return Message(**(await self.request("GET", f"/chat/thread/{thread_id}/message/{message_id}"))["message"])
+        return self.parse(Message, (await self.request("GET", f"/chat/thread/{thread_id}/message/{message_id}"))["message"])
 
     async def get_chat_messages(self, thread_id: str, size: int = 100, page_token: str = None) -> List[Message]:
         if not page_token: params = f"v=2&pagingType=t&size={size}"
         else: params = f"v=2&pagingType=t&pageToken={page_token}&size={size}"
 
         response = await self.request("GET", f"/chat/thread/{thread_id}/message?{params}")
-        return list(map(lambda o: Message(**o, **response.get("paging", {})),  response["messageList"]))
+        return self.parse_list(Message, response["messageList"], **response.get("paging", {}))
     
     async def get_user_following(self, uid: str, start: int = 0, size: int = 100) -> List[UserProfile]:
         response = await self.request("GET", f"/user-profile/{uid}/joined?start={start}&size={size}")
-        return list(map(lambda o: UserProfile(**o), response["userProfileList"]))
+        return self.parse_list(UserProfile, response["userProfileList"])
 
     async def get_user_followers(self, uid: str, start: int = 0, size: int = 100) -> List[UserProfile]:
         response = await self.request("GET", f"/user-profile/{uid}/member?start={start}&size={size}")
-        return list(map(lambda o: UserProfile(**o), response["userProfileList"]))
+        return self.parse_list(UserProfile, response["userProfileList"])
 
     async def get_blocked_users(self, start: int = 0, size: int = 100) -> List[UserProfile]:
         response = await self.request("GET", f"/block?start={start}&size={size}")
-        return list(map(lambda o: UserProfile(**o), response["userProfileList"]))
+        return self.parse_list(UserProfile, response["userProfileList"])
     
     async def get_blocker_users(self, start: int = 0, size: int = 100) -> List[str]:
         response = await self.request("GET", f"/block/full-list?start={start}&size={size}")
         return response["blockerUidList"]
 
     async def get_wiki_info(self, wiki_id: str) -> Wiki:
-        return Wiki(**(await self.request("GET", f"/item/{wiki_id}"))["item"])
+        return self.parse(Wiki, (await self.request("GET", f"/item/{wiki_id}"))["item"])
     
     async def get_blog_info(self, blog_id: str) -> Blog:
-        return Blog(**(await self.request("GET", f"/blog/{blog_id}"))["blog"])
+        return self.parse(Blog, (await self.request("GET", f"/blog/{blog_id}"))["blog"])
     
     async def get_blog_comments(self, blog_id: str, sorting: str = "newest", start: int = 0, size: int = 100) -> List[Comment]:
         response = await self.request("GET", f"/blog/{blog_id}/comment?sort={sorting}&start={start}&size={size}")
-        return list(map(lambda o: Comment(**o), response["commentList"]))
+        return self.parse_list(Comment, response["commentList"])
 
     async def get_wiki_comments(self, wiki_id: str, sorting: str = "newest", start: int = 0, size: int = 100) -> List[Comment]:
         response = await self.request("GET", f"/item/{wiki_id}/comment?sort={sorting}&start={start}&size={size}")
-        return list(map(lambda o: Comment(**o), response["commentList"]))
+        return self.parse_list(Comment, response["commentList"])
     
     async def get_wall_comments(self, uid: str, sorting: str, start: int = 0, size: int = 100) -> List[Comment]:
         response = await self.request("GET", f"/user-profile/{uid}/g-comment?sort={sorting}&start={start}&size={size}")
-        return list(map(lambda o: Comment(**o), response["commentList"]))
+        return self.parse_list(Comment, response["commentList"])
     
     async def send_message(self, thread_id: str, message: str = None, type: int = 0, reply_to_id: str = None, 
             mentions: list = None, embed_id: str = None, embed_type: int = None, embed_link: str = None, 
@@ -894,11 +1029,11 @@ class HttpClient:
 
     async def get_linked_communities(self, uid: str) -> List[Community]:
         response = await self.request("GET", f"/user-profile/{uid}/linked-community", ndc_id=GLOBAL_ID)
-        return list(map(lambda o: Community(**o), response["linkedCommunityList"]))
+        return self.parse_list(Community, response["linkedCommunityList"])
 
     async def get_unlinked_communities(self, uid: str) -> List[Community]:
         response = await self.request("GET", f"/user-profile/{uid}/linked-community", ndc_id=GLOBAL_ID)
-        return list(map(lambda o: Community(**o), response["unlinkedCommunityList"]))
+        return self.parse_list(Community, response["unlinkedCommunityList"])
 
     async def reorder_linked_communities(self, ndc_ids: list) -> int:
         data = jsonify(ndcIds=ndc_ids)
@@ -1006,19 +1141,19 @@ class HttpClient:
 
     async def get_membership_info(self) -> Membership:
         response = await self.request("GET", "/membership?force=true")
-        return Membership(**response)
+        return self.parse(Membership, response)
 
     async def get_ta_announcements(self, lang: str = "en", start: int = 0, size: int = 100) -> List[Blog]:
         response = await self.request("GET", f"/announcement?language={lang}&start={start}&size={size}")
-        return list(map(lambda o: Blog(**o), response["blogList"]))
+        return self.parse_list(Blog, response["blogList"])
 
     async def get_wallet_info(self) -> Wallet:
         response = await self.request("GET", "/wallet")
-        return Wallet(**response["wallet"])
+        return self.parse(Wallet, response["wallet"])
 
     async def get_wallet_history(self, start: int = 0, size: int = 100) -> List[Transaction]:
         response = await self.request("GET", f"/wallet/coin/history?start={start}&size={size}")
-        return list(map(lambda o: Transaction(**o), response["coinHistoryList"]))
+        return self.parse_list(Transaction, response["coinHistoryList"])
 
     async def get_from_device(self, device_id: str) -> str:
         return (await self.request("GET", f"/auid?deviceId={device_id}"))["auid"]
@@ -1045,23 +1180,23 @@ class HttpClient:
 
     async def get_all_users(self, start: int = 0, size: int = 100) -> List[UserProfile]:
         response = await self.request("GET", f"/user-profile?type={UserTypes.RECENT}&start={start}&size={size}")
-        return list(map(lambda o: UserProfile(**o), response["userProfileList"]))
+        return self.parse_list(UserProfile, response["userProfileList"])
     
     async def get_community_leaders(self, start: int = 0, size: int = 100) -> List[UserProfile]:
         response = await self.request("GET", f"/user-profile?type={UserTypes.LEADERS}&start={start}&size={size}")
-        return list(map(lambda o: UserProfile(**o), response["userProfileList"]))
+        return self.parse_list(UserProfile, response["userProfileList"])
     
     async def get_community_curators(self, start: int = 0, size: int = 100) -> List[UserProfile]:
         response = await self.request("GET", f"/user-profile?type={UserTypes.CURATORS}&start={start}&size={size}")
-        return list(map(lambda o: UserProfile(**o), response["userProfileList"]))
+        return self.parse_list(UserProfile, response["userProfileList"])
     
     async def get_banned_users(self, start: int = 0, size: int = 100) -> List[UserProfile]:
         response = await self.request("GET", f"/user-profile?type={UserTypes.BANNED}&start={start}&size={size}")
-        return list(map(lambda o: UserProfile(**o), response["userProfileList"]))
+        return self.parse_list(UserProfile, response["userProfileList"])
     
     async def get_featured_users(self, start: int = 0, size: int = 100) -> List[UserProfile]:
         response = await self.request("GET", f"/user-profile?type={UserTypes.FEATURED}d&start={start}&size={size}")
-        return list(map(lambda o: UserProfile(**o), response["userProfileList"])) 
+        return self.parse_list(UserProfile, response["userProfileList"])
     
     async def accept_host(self, thread_id: str, request_id: str):
         return await self.request("POST", f"/chat/thread/{thread_id}/transfer-organizer/{request_id}/accept")
@@ -1071,15 +1206,15 @@ class HttpClient:
 
     async def get_chat_bubbles(self, thread_id: str, start: int = 0, size: int = 100) -> List[ChatBubble]:
         response = await self.request("GET", f"/chat/chat-bubble?type=all-my-bubbles?threadId={thread_id}?start={start}?size={size}")
-        return list(map(lambda o: UserProfile(**o), response["chatBubbleList"]))
+        return self.parse_list(UserProfile, response["chatBubbleList"])
     
     async def get_chat_bubble(self, bubble_id: str) -> ChatBubble:
         response = await self.request("GET", f"/chat/chat-bubble/{bubble_id}")
-        return ChatBubble(**response["chatBubble"])
+        return self.parse(ChatBubble, response["chatBubble"])
 
     async def get_chat_bubble_templates(self, start: int = 0, size: int = 100) -> List[ChatBubble]:
         response = await self.request("GET", f"/chat/chat-bubble/templates?start={start}&size={size}")
-        return list(map(lambda o: ChatBubble(**o), response["templateList"]))
+        return self.parse_list(ChatBubble, response["templateList"])
     
     async def generate_chat_bubble(self, bubble: bytes = None, template_id: str = "949156e1-cc43-49f0-b9cf-3bbbb606ad6e") -> ChatBubble:
         response = await self.request("POST", f"/chat/chat-bubble/templates/{template_id}/generate", bubble, content_type=ContentTypes.OCTET_STREAM)
@@ -1091,7 +1226,7 @@ class HttpClient:
 
     async def get_avatar_frames(self, start: int = 0, size: int = 100):
         response = await self.request("GET", f"/avatar-frame?start={start}&size={size}")
-        return list(map(lambda o: AvatarFrame(**o), response["avatarFrameList"]))
+        return self.parse_list(AvatarFrame, response["avatarFrameList"])
 
     async def change_chat_bubble(self, bubble_id: str, thread_id: str = None) -> int:
         data = jsonify(
@@ -1124,7 +1259,7 @@ class HttpClient:
 
     async def get_invite_codes(self, ndc_id: int = None, status: str = "normal", start: int = 0, size: int = 100) -> List[InviteCode]:
         response = await self.request("GET", f"/community/invitation?status={status}&start={start}&size={size}", ndc_id=-(ndc_id or self.ndc_id))
-        return list(map(lambda o: InviteCode(**o), response["communityInvitationList"]))
+        return self.parse_list(InviteCode, response["communityInvitationList"])
 
     async def generate_invite_code(self, ndc_id: int = None, duration: int = 0, force: bool = True):
         data = jsonify(duration=duration, force=force)
@@ -1352,7 +1487,7 @@ class HttpClient:
 
     async def get_vc_reputation_info(self, thread_id: str) -> VcReputation:
         response = await self.request("GET", f"/chat/thread/{thread_id}/avchat-reputation")
-        return VcReputation(**response)
+        return self.parse(VcReputation, response)
 
     async def claim_vc_reputation(self, thread_id: str) -> VcReputation:
         response = await self.request("POST", f"/chat/thread/{thread_id}/avchat-reputation")
@@ -1360,109 +1495,109 @@ class HttpClient:
 
     async def get_online_favorite_users(self, start: int = 0, size: int = 100) -> List[UserProfile]:
         response = await self.request("GET", f"/user-group/quick-access?type=online&start={start}&size={size}")
-        return list(map(lambda o: UserProfile(**o), response["userProfileList"]))
+        return self.parse_list(UserProfile, response["userProfileList"])
 
     async def get_user_checkins(self, uid: str) -> List[CheckIn]:
         response = await self.request("GET", f"/check-in/stats/{uid}?timezone={0}")
-        return list(map(lambda o: CheckIn(**o), response))
+        return self.parse_list(CheckIn, response)
 
     async def get_user_blogs(self, uid: str, start: int = 0, size: int = 100) -> List[Blog]:
         response = await self.request("GET", f"/blog?type=user&q={uid}&start={start}&size={size}")
-        return list(map(lambda o: Blog(**o), response["blogList"]))
+        return self.parse_list(Blog, response["blogList"])
 
     async def get_user_wikis(self, uid: str, start: int = 0, size: int = 100) -> List[Wiki]:
         response = await self.request("GET", f"/item?type=user-all&start={start}&size={size}&cv=1.2&uid={uid}")
-        return list(map(lambda o: Wiki(**o), response["itemList"]))
+        return self.parse_list(Wiki, response["itemList"])
 
     async def get_user_achievements(self, uid: str) -> Achievement:
         response = await self.request("GET", f"/user-profile/{uid}/achievements")
-        return Achievement(**response["achievements"])
+        return self.parse(Achievement, response["achievements"])
 
     async def get_influencer_fans(self, uid: str, start: int = 0, size: int = 100) -> List[UserProfile]:
         response = await self.request("GET", f"/influencer/{uid}/fans?start={start}&size={size}")
-        return list(map(lambda o: UserProfile(**o), response))
+        return self.parse_list(UserProfile, response)
 
     async def search_users(self, nickname: str, start: int = 0, size: int = 100) -> List[UserProfile]:
         response = await self.request("GET", f"/user-profile?type=name&q={nickname}&start={start}&size={size}")
-        return list(map(lambda o: UserProfile(**o), response["userProfileList"]))
+        return self.parse_list(UserProfile, response["userProfileList"])
 
     async def get_saved_blogs(self, start: int = 0, size: int = 100) -> List[Bookmark]:
         response = await self.request("GET", f"/bookmark?start={start}&size={size}")
-        return list(map(lambda o: Bookmark(**o), response["bookmarkList"]))
+        return self.parse_list(Bookmark, response["bookmarkList"])
     
     async def get_leaderboard_info(self, type: int, start: int = 0, size: int = 100) -> List[UserProfile]:
         response = await self.request("GET", f"/community/leaderboard?rankingType={type}&start={start}&size={size}")
-        return list(map(lambda o: UserProfile(**o), response["userProfileList"]))
+        return self.parse_list(UserProfile, response["userProfileList"])
 
     async def get_blog_tipped_users(self, blog_id: str, start: int = 0, size: int = 100) -> List[TippedUserSummary]:
         response = await self.request("GET", f"/blog/{blog_id}/tipping/tipped-users-summary?start={start}&size={size}")
-        return list(map(lambda o: TippedUserSummary(**o), response))
+        return self.parse_list(TippedUserSummary, response)
 
     async def get_wiki_tipped_users(self, wiki_id: str, start: int = 0, size: int = 100) -> List[TippedUserSummary]:
         response = await self.request("GET", f"/item/{wiki_id}/tipping/tipped-users-summary?start={start}&size={size}")
-        return list(map(lambda o: TippedUserSummary(**o), response))
+        return self.parse_list(TippedUserSummary, response)
     
     async def get_chat_tipped_users(self, thread_id: str, start: int = 0, size: int = 100) -> List[TippedUserSummary]:
         response = await self.request("GET", f"/chat/thread/{thread_id}/tipping/tipped-users-summary?start={start}&size={size}")
-        return list(map(lambda o: TippedUserSummary(**o), response))
+        return self.parse_list(TippedUserSummary, response)
     
     async def get_file_tipped_users(self, file_id: str, start: int = 0, size: int = 100) -> List[TippedUserSummary]:
         response = await self.request("GET", f"/shared-folder/files/{file_id}/tipping/tipped-users-summary?start={start}&size={size}")
-        return list(map(lambda o: TippedUserSummary(**o), response))
+        return self.parse_list(TippedUserSummary, response)
 
     async def get_public_chat_threads(self, type: str = "recommended", start: int = 0, size: int = 100) -> List[Thread]:
         response = await self.request("GET", f"/chat/thread?type=public-all&filterType={type}&start={start}&size={size}")
-        return list(map(lambda o: Thread(**o), response["threadList"]))
+        return self.parse_list(Thread, response["threadList"])
     
     async def get_blog_categories(self, size: int = 100) -> List[BlogCategory]:
         response = await self.request("GET", f"/blog-category?size={size}")
-        return list(map(lambda o: BlogCategory(**o), response["blogCategoryList"]))
+        return self.parse_list(BlogCategory, response["blogCategoryList"])
 
     async def get_blogs_by_category(self, category_id: str, start: int = 0, size: int = 100) -> List[Blog]:
         response = await self.request("GET", f"/blog-category/{category_id}/blog-list?start={start}&size={size}")
-        return list(map(lambda o: Blog(**o), response["blogList"]))
+        return self.parse_list(Blog, response["blogList"])
 
     async def get_quiz_rankings(self, quiz_id: str, start: int = 0, size: int = 100)-> QuizRanking:
         response = await self.request("GET", f"/blog/{quiz_id}/quiz/result?start={start}&size={size}")
-        return QuizRanking(**response)
+        return self.parse(QuizRanking, response)
 
-    async def get_recent_blogs(self, page_token: str = None, start: int = 0, size: int = 100) -> Blog:
+    async def get_recent_blogs(self, page_token: str = None, start: int = 0, size: int = 100) -> List[Blog]:
         if not page_token: params = f"v=2&pagingType=t&start={start}&size={size}"
         else: params = f"v=2&pagingType=t&pageToken={page_token}&start={start}&size={size}"
         
         response = await self.request("GET", f"/feed/blog-all?{params}")
-        return list(map(lambda o: Message(**o, **response.get("paging", {})),  response["blogList"]))
+        return self.parse_list(Blog, response["blogList"], **response.get("paging", {}))
     
     async def get_recent_wikis(self, start: int = 0, size: int = 25):
         response = await self.request("GET", f"/item?type=catalog-all&start={start}&size={size}")
-        return list(map(lambda o: Wiki(**o), response["itemList"]))
+        return self.parse_list(Wiki, response["itemList"])
     
     async def get_notifications(self, start: int = 0, size: int = 100) -> Dict:
         return await self.request("GET", f"/notification?pagingType=t&start={start}&size={size}")["notificationList"]
     
     async def get_sticker_pack_info(self, sticker_pack_id: str) -> StickerCollection:
         response = await self.request("GET", f"/sticker-collection/{sticker_pack_id}?includeStickers=true")
-        return StickerCollection(**response["stickerCollection"])
+        return self.parse(StickerCollection, response["stickerCollection"])
 
     async def get_sticker_packs(self) -> List[StickerCollection]:
         response = await self.request("GET", f"/sticker-collection?includeStickers=false&type=my-active-collection")
-        return list(map(lambda o: StickerCollection(**o), response["stickerCollection"]))
+        return self.parse_list(StickerCollection, response["stickerCollection"])
 
     async def get_store_chat_bubbles(self, start: int = 0, size: int = 100) -> List[StoreItem]:
         response = await self.request("GET", f"/store/items?sectionGroupId=chat-bubble&start={start}&size={size}")
-        return list(map(lambda o: StoreItem(**o), response["stickerCollection"]))
+        return self.parse_list(StoreItem, response["stickerCollection"])
 
     async def get_store_stickers(self, start: int = 0, size: int = 100) -> List[StoreItem]:
         response = await self.request("GET", f"/store/items?sectionGroupId=sticker&start={start}&size={size}")
-        return list(map(lambda o: StoreItem(**o), response["stickerCollection"]))
+        return self.parse_list(StoreItem, response["stickerCollection"])
     
     async def get_community_stickers(self) -> List[StickerCollection]:
         response = await self.request("GET", f"/sticker-collection?type=community-shared")
-        return list(map(lambda o: StickerCollection(**o), response))
+        return self.parse_list(StickerCollection, response)
 
     async def get_sticker_collection(self, collection_id: str) -> StickerCollection:
         response = await self.request("GET", f"/sticker-collection/{collection_id}?includeStickers=true")
-        return StickerCollection(**response["stickerCollection"])
+        return self.parse(StickerCollection, response["stickerCollection"])
 
     async def get_shared_folder_info(self) -> Dict:
         return await self.request("GET", f"/shared-folder/stats")["stats"]
@@ -1472,23 +1607,23 @@ class HttpClient:
 
     async def get_hidden_blogs(self, start: int = 0, size: int = 100) -> Blog:
         response = await self.request("GET", f"/feed/blog-disabled?start={start}&size={size}")
-        return list(map(lambda o: Blog(**o), response["blogList"]))
+        return self.parse_list(Blog, response["blogList"])
 
     async def review_quiz_questions(self, quiz_id: str) -> List[Blog.QuizQuestion]:
         response = await self.request("GET", f"/blog/{quiz_id}?action=review")
-        return list(map(lambda o: Blog.QuizQuestion(**o), response["blog"]["quizQuestionList"]))
+        return self.parse_list(Blog.QuizQuestion, response["blog"]["quizQuestionList"])
 
     async def get_recent_quiz(self, start: int = 0, size: int = 100) -> Blog:
         response = await self.request("GET", f"/blog?type=quizzes-recent&start={start}&size={size}")
-        return list(map(lambda o: Blog(**o), response["blogList"]))
+        return self.parse_list(Blog, response["blogList"])
 
     async def get_trending_quiz(self, start: int = 0, size: int = 100) -> Blog:
         response = await self.request("GET", f"/feed/quiz-trending?start={start}&size={size}")
-        return list(map(lambda o: Blog(**o), response["blogList"]))
+        return self.parse_list(Blog, response["blogList"])
 
     async def get_best_quiz(self, start: int = 0, size: int = 100) -> Blog:
         response = await self.request("GET", f"/feed/quiz-best-quizzes?start={start}&size={size}")
-        return list(map(lambda o: Blog(**o), response["blogList"]))
+        return self.parse_list(Blog, response["blogList"])
 
     async def reorder_featured_users(self, uids: list) -> int:
         data = jsonify(uidList=uids)
@@ -1496,19 +1631,19 @@ class HttpClient:
     
     async def user_moderation_history(self, uid: str = None, size: int = 100) -> List[AdminLog]:
         response = await self.request("GET", f"/admin/operation?pagingType=t&size={size}&objectId={uid}&objectType={ObjectTypes.USER}")
-        return list(map(lambda o: AdminLog(**o), response["adminLogList"]))
+        return self.parse_list(AdminLog, response["adminLogList"])
 
     async def blog_moderation_history(self, blog_id: str = None, size: int = 100) -> List[AdminLog]:
         response = await self.request("GET", f"/admin/operation?pagingType=t&size={size}&objectId={blog_id}&objectType={ObjectTypes.BLOG}")
-        return list(map(lambda o: AdminLog(**o), response["adminLogList"]))
+        return self.parse_list(AdminLog, response["adminLogList"])
 
     async def wiki_moderation_history(self, wiki_id: str = None, size: int = 100) -> List[AdminLog]:
         response = await self.request("GET", f"/admin/operation?pagingType=t&size={size}&objectId={wiki_id}&objectType={ObjectTypes.ITEM}")
-        return list(map(lambda o: AdminLog(**o), response["adminLogList"]))
+        return self.parse_list(AdminLog, response["adminLogList"])
 
     async def file_moderation_history(self, file_id: str = None, size: int = 100) -> List[AdminLog]:
         response = await self.request("GET", f"/admin/operation?pagingType=t&size={size}&objectId={file_id}&objectType={ObjectTypes.FOLDER_FILE}")
-        return list(map(lambda o: AdminLog(**o), response["adminLogList"]))
+        return self.parse_list(AdminLog, response["adminLogList"])
 
     async def feature_user(self, seconds: int, uid: str) -> int:
         data = jsonify(
@@ -1773,58 +1908,58 @@ class HttpClient:
     
     async def get_online_users(self, ndc_id: int = None, start: int = 0, size: int = 100) -> List[UserProfile]:
         response = await self.request("GET", f"/live-layer?topic=ndtopic:x{ndc_id or self.ndc_id}:online-members&start={start}&size={size}")
-        return list(map(lambda o: UserProfile(**o), response["userProfileList"]))
+        return self.parse_list(UserProfile, response["userProfileList"])
     
     async def get_online_users_count(self, ndc_id: int = None) -> int:
         return (await self.request("GET", f"/live-layer?topic=ndtopic:x{ndc_id or self.ndc_id}:online-members&start=0&size=1"))["userProfileCount"]
     
     async def get_public_chats(self, start: int = 0, size: int = 100) -> List[Thread]:
         response = await self.request("GET", f"/live-layer/public-chats?start={start}&size={size}")
-        return list(map(lambda o: UserProfile(**o), response["threadList"]))
+        return self.parse_list(UserProfile, response["threadList"])
     
     async def get_chatting_users(self, ndc_id: int = None, start: int = 0, size: int = 100) -> List[UserProfile]:
         response = await self.request("GET", f"/live-layer?topic=ndtopic:x{ndc_id or self.ndc_id}:users-chatting&start={start}&size={size}")
-        return list(map(lambda o: UserProfile(**o), response["userProfileList"]))
+        return self.parse_list(UserProfile, response["userProfileList"])
     
     async def get_chatting_users_count(self, ndc_id: int = None) -> int:
         return (await self.request("GET", f"/live-layer?topic=ndtopic:x{ndc_id or self.ndc_id}:users-chatting&start=0&size=1"))["userProfileCount"]
 
     async def get_live_chats(self, start: int = 0, size: int = 100) -> List[Thread]:
         response = await self.request("GET", f"/live-layer/public-live-chats?start={start}&size={size}")
-        return list(map(lambda o: Thread(**o), response["threadList"]))
+        return self.parse_list(Thread, response["threadList"])
     
     async def get_live_chatting_users(self, ndc_id: int = None, start: int = 0, size: int = 100) -> List[UserProfile]:
         response = await self.request("GET", f"/live-layer?topic=ndtopic:x{ndc_id or self.ndc_id}:users-live-chatting&start={start}&size={size}")
-        return list(map(lambda o: UserProfile(**o), response["userProfileList"]))
+        return self.parse_list(UserProfile, response["userProfileList"])
     
     async def get_live_chatting_users_count(self, ndc_id: int = None) -> int:
         return (await self.request("GET", f"/live-layer?topic=ndtopic:x{ndc_id or self.ndc_id}:users-live-chatting&start=0&size=1"))["userProfileCount"]
 
     async def get_playing_quizzes(self, start: int = 0, size: int = 100) -> List[Blog]:
         response = await self.request("GET", f"/live-layer/quizzes?start={start}&size={size}")
-        return list(map(lambda o: Blog(**o), response["blogList"]))
+        return self.parse_list(Blog, response["blogList"])
     
     async def get_playing_quizzes_users(self, ndc_id: int = None, start: int = 0, size: int = 100) -> List[UserProfile]:
         response = await self.request("GET", f"/live-layer?topic=ndtopic:x{ndc_id or self.ndc_id}:users-playing-quizzes&start={start}&size={size}")
-        return list(map(lambda o: UserProfile(**o), response["userProfileList"]))
+        return self.parse_list(UserProfile, response["userProfileList"])
     
     async def get_playing_quizzes_users_count(self, ndc_id: int = None) -> int:
         return (await self.request("GET", f"/live-layer?topic=ndtopic:x{ndc_id or self.ndc_id}:users-playing-quizzes&start=0&size=1"))["userProfileCount"]
 
     async def get_browsing_blogs(self, start: int = 0, size: int = 100) -> List[Blog]:
         response = await self.request("GET", f"/live-layer/blogs?start={start}&size={size}")
-        return list(map(lambda o: Blog(**o), response["blogList"]))
+        return self.parse_list(Blog, response["blogList"])
     
     async def get_browsing_blogs_users(self, ndc_id: int = None, start: int = 0, size: int = 100) -> List[UserProfile]:
         response = await self.request("GET", f"/live-layer?topic=ndtopic:x{ndc_id or self.ndc_id}:users-browsing-blogs&start={start}&size={size}")
-        return list(map(lambda o: UserProfile(**o), response["userProfileList"]))
+        return self.parse_list(UserProfile, response["userProfileList"])
     
     async def get_browsing_blogs_users_count(self, ndc_id: int = None) -> int:
         return (await self.request("GET", f"/live-layer?topic=ndtopic:x{ndc_id or self.ndc_id}:users-browsing-blogs&start=0&size=1"))["userProfileCount"]
 
     async def get_blog_users(self, blog_id: str, ndc_id: int = None, start: int = 0, size: int = 100):
         response = await self.request("GET", f"/live-layer?topic=ndtopic:x{ndc_id or self.ndc_id}:users-browsing-blog-at:{blog_id}&start={start}&size={size}")
-        return list(map(lambda o: UserProfile(**o), response["userProfileList"]))
+        return self.parse_list(UserProfile, response["userProfileList"])
     
     async def activate_bubble(self, bubble_id: str) -> int:
         return await self.request("POST", f"/chat/chat-bubble/{bubble_id}/activate")
@@ -1834,7 +1969,7 @@ class HttpClient:
 
     async def send_active_object(self, timers: List[Dict], timezone: int = 0, flags: int = 2147483647):
         data = jsonify(userActiveTimeChunkList=timers, optInAdsFlags=flags, timezone=timezone, timestamp=int(time() * 1000))
-        return await self.request("POST", "/community/stats/user-active-time", data=json_minify(json.dumps(data)))
+        return await self.request("POST", "/community/stats/user-active-time", data=dumps(data))
     
     async def create_community(self, name: str, tagline: str, icon: Union[str, bytes], themeColor: str, joinType: int = 0, primaryLanguage: str = "en"):
         data = jsonify(
@@ -1881,7 +2016,7 @@ class HttpClient:
 
     async def get_managed_communities(self, start: int = 0, size: int = 25):
         response = await self.request("GET", f"/community/managed?start={start}&size={size}", ndc_id=GLOBAL_ID)
-        return list(map(lambda o: Community(**o), response["communityList"]))
+        return self.parse_list(Community, response["communityList"])
     
     # TODO : Finish it
     async def get_categories(self, start: int = 0, size: int = 25):
@@ -1909,7 +2044,7 @@ class HttpClient:
 
     async def get_join_requests(self, start: int = 0, size: int = 25):
         response = await self.request("GET", f"/community/membership-request?status=pending&start={start}&size={size}")
-        return list(map(lambda o: UserProfile(**o), response["communityMembershipRequestList"])) 
+        return self.parse_list(UserProfile, response["communityMembershipRequestList"])
     
     async def get_join_requests(self, start: int = 0, size: int = 25):
         response = await self.request("GET", f"/community/membership-request?status=pending&start={start}&size={size}")
@@ -1925,11 +2060,11 @@ class HttpClient:
 
     async def get_community_stats(self):
         response = await self.request("GET", f"/community/stats")
-        return CommunityStatistic(**response['communityStats'])
+        return self.parse(CommunityStatistic, response['communityStats'])
 
     async def get_community_user_stats(self, type: str, start: int = 0, size: int = 25):
         response = await self.request("GET", f"/community/stats/moderation?type={type}&start={start}&size={size}")
-        return list(map(lambda o: UserProfile(**o), response["userProfileList"]))
+        return self.parse_list(UserProfile, response["userProfileList"])
 
     async def change_welcome_message(self, message: str, isEnabled: bool = True):
         data = jsonify(
@@ -1994,3 +2129,29 @@ class HttpClient:
     async def delete_pending_role(self, noticeId: str):
         response = self.request("DELETE", f"/notice/{noticeId}")
         return response
+
+
+SIGNALS_INSTALLED = False
+PREVIOUS_HANDLERS: Dict[int, Any] = {}
+
+
+def _on_close(signum, frame):
+    HttpClient.pool.shutdown()
+    
+    # Hand the signal on to whatever handled it before us.
+    signal.signal(signum, PREVIOUS_HANDLERS.pop(signum, None) or signal.SIG_DFL)
+    os.kill(os.getpid(), signum)
+
+
+def install_signal_handlers() -> None:
+    global SIGNALS_INSTALLED
+    
+    if SIGNALS_INSTALLED:
+        return
+    
+    try:
+        PREVIOUS_HANDLERS[signal.SIGTERM] = signal.signal(signal.SIGTERM, _on_close)
+    except ValueError:
+        return  # not the main thread
+    
+    SIGNALS_INSTALLED = True
@@ -1,39 +1,99 @@
-import json
 import random
 import sys
 
 from time import time
 from contextlib import suppress
-from asyncio import AbstractEventLoop, sleep, wait_for, exceptions
-from typing import Dict
+from asyncio import AbstractEventLoop, Task, sleep, wait_for, exceptions
+from inspect import isawaitable
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Tuple
 from aiohttp.client import ClientSession
 from aiohttp.client_exceptions import WSServerHandshakeError
 from aiohttp.client_ws import ClientWebSocketResponse as WSConnection
 from eventemitter.emitter import EventEmitter
 
 from .helpers.models import Auth
-from .helpers.types import EventTypes, allTypes
+from .helpers.dispatch import CommandRouter, EventQueue
+from .helpers.types import EVENT_TYPES, BackpressureTypes, EventTypes
+from .helpers.serializer import dumps, loads
 from .helpers.utils import generate_signature, get_event_loop
 
 
+def thread_key(recieved_data: Dict) -> Optional[str]:
+    data = recieved_data.get("o") or {}
+    return (data.get("chatMessage") or {}).get("threadId") or data.get("threadId")
+
+
 class AminoWebSocket:
-    def __init__(self, auth: Auth, loop: AbstractEventLoop = None) -> None:
+    def __init__(
+        self, 
+        auth: Auth, 
+        loop: AbstractEventLoop = None,
+        workers: int = 0,
+        queue_size: int = 1000,
+        backpressure: Optional[str] = None,
+        lanes: int = 0,
+        lane_key: Optional[Callable[[Dict], Any]] = None
+    ) -> None:
         self._session: ClientSession = None
         self._connection: WSConnection = None
         self._loop: AbstractEventLoop = loop or get_event_loop()
 
         self.auth: Auth = auth
+        # The client owning this socket, events reply through its views.
+        self.client: Optional[Any] = None
         self.emitter: EventEmitter = EventEmitter()
 
         self.reconnecting: bool = None
         self.reconnect_cooldown: int = 120
         
-        self.bot_commands = []
+        self.bot_commands: CommandRouter = CommandRouter()
         self.wait_responses = {}
+        
+        self._event_class: Optional[type] = None
+        self.lazy_events: bool = False
+        self.handlers: Dict[int, Callable[[Dict], None]] = {
+            1000: self.on_message,
+            10: self.on_notification,
+            304: self.on_action,
+            306: self.on_action
+        }
+        
+        # With workers > 0 frames are queued by the reader and handled
+        # by a pool of tasks which wait for handlers to finish, a full
+        # queue blocks the reader by default.
+        # With lanes > 0 frames are sharded by lane_key (threadId by default)
+        # onto ordered queues with one worker each, lanes win over workers.
+        # A full lane must never block the reader, that would stall every
+        # other lane too, so lanes drop their oldest frame by default and
+        # BLOCK is rejected. Frames without a key (notifications, actions,
+        # replies to post()) go to an unbounded control lane that never drops.
+        if lanes and backpressure == BackpressureTypes.BLOCK:
+            raise Exception("Lanes can't block the reader, use a drop backpressure policy.")
+        
+        self.workers: int = workers
+        self.queue: Optional[EventQueue] = None
+        self.lanes: List[EventQueue] = [
+            EventQueue(queue_size, backpressure or BackpressureTypes.DROP_OLDEST) for _ in range(lanes)]
+        self.control: Optional[EventQueue] = EventQueue(0) if lanes else None
+        self.lane_key: Callable[[Dict], Any] = lane_key or thread_key
+        self._worker_tasks: List[Task] = []
+        self._awaiting: List[Tuple[str, Callable, Awaitable]] = []
+        
+        if workers and not lanes:
+            self.queue = EventQueue(queue_size, backpressure or BackpressureTypes.BLOCK)
     
     async def run(self):
         self._connection = await self.create_connection()
         self._loop.create_task(self.connection_reciever())
+        
+        if not self._worker_tasks:
+            if self.lanes:
+                self._worker_tasks = [self._loop.create_task(self.dispatch_worker(queue)) 
+                                      for queue in self.queues]
+            
+            elif self.queue is not None:
+                self._worker_tasks = [self._loop.create_task(self.dispatch_worker(self.queue)) 
+                                      for _ in range(self.workers or 1)]
 
         self.reconnecting = True
         self._loop.create_task(self.reconnecting_task())
@@ -42,7 +102,7 @@ class AminoWebSocket:
         if "id" not in data:
             data["id"] = "999345999"
             
-        await self._connection.send_str(json.dumps(data))
+        await self._connection.send_str(dumps(data).decode())
         
     async def post(self, type: int, data: Dict):
         data["id"] = str(random.randint(100000000,999999999))
@@ -65,46 +125,121 @@ class AminoWebSocket:
                 continue
 
             with suppress(TypeError):
-                recieved_data = await self._connection.receive_json()
-
-                if recieved_data["t"] == 1000:
-                    try:
-                    
-                        context = getattr(sys.modules["aminoed"], "Event")
-                        
-                        event = context(self.auth, recieved_data["o"])       
-                        self.emitter.emit(EventTypes.MESSAGE, event)
-                        
-                        event_type = f"{event.type}:{event.mediaType}"
-                        
-                        if event_type in allTypes(EventTypes):
-                            self.emitter.emit(event_type, event)
-                            
-                        if event_type == EventTypes.TEXT_MESSAGE:
-                            for command in self.bot_commands:
-                                if event.content.lower().startswith(command):
-                                    self.emitter.emit(command, event)
-                                    
-                    except Exception as e:
-                        print(e)
+                recieved_data = await self._connection.receive_json(loads=loads)
                 
-                elif recieved_data["t"] == 10:
-                    self.emitter.emit(EventTypes.NOTIFICATION, recieved_data["o"])
+                if self.lanes:
+                    if (key := self.lane_key(recieved_data)) is None:
+                        await self.control.put(recieved_data)
+                    else:
+                        await self.lanes[hash(key) % len(self.lanes)].put(recieved_data)
                 
-                elif recieved_data["t"] == 306 or recieved_data["t"] == 304:
-                    self.emitter.emit(EventTypes.ACTION, recieved_data["o"])
-                    
-                    if recieved_data["o"]["actions"][0] == "Typing":
-                        if recieved_data["t"] == 304:
-                            self.emitter.emit(EventTypes.USER_TYPING_START, recieved_data["o"])
-                            
-                        if recieved_data["t"] == 306:
-                            self.emitter.emit(EventTypes.USER_TYPING_END, recieved_data["o"])
+                elif self.queue is not None:
+                    await self.queue.put(recieved_data)
                 
-                self.emitter.emit(EventTypes.ANY, recieved_data)
+                else:
+                    self.dispatch(recieved_data)
+    
+    @property
+    def queue_depth(self) -> int:
+        return sum(queue.depth for queue in self.queues)
+    
+    @property
+    def dropped(self) -> int:
+        return sum(queue.dropped for queue in self.queues)
+    
+    @property
+    def queues(self) -> List[EventQueue]:
+        if self.lanes:
+            return [*self.lanes, self.control]
+        return [self.queue] if self.queue is not None else []
+    
+    async def dispatch_worker(self, queue: EventQueue):
+        while True:
+            recieved_data = await queue.get()
+            
+            try:
+                self.dispatch(recieved_data)
+            except Exception as e:
+                print(e)
+            finally:
+                # dispatch() never yields, so the handlers collected
+                # here belong to this frame only.
+                awaiting, self._awaiting = self._awaiting, []
+            
+            for event, listener, result in awaiting:
+                try:
+                    await result
+                except Exception as e:
+                    self.emitter.emit(self.emitter.LISTENER_ERROR_EVENT, event, listener, e)
+            
+            queue.task_done()
+    
+    def emit(self, event: str, *args: Any) -> None:
+        if not self.queues:
+            self.emitter.emit(event, *args)
+            return
+        
+        listeners = self.emitter.listeners(event)
+        self.emitter._once[event] = []
+        
+        for listener in listeners:
+            try:
+                result = listener(*args)
+            except Exception as e:
+                self.emitter.emit(self.emitter.LISTENER_ERROR_EVENT, event, listener, e)
+                continue
+            
+            if isawaitable(result):
+                self._awaiting.append((event, listener, result))
+    
+    @property
+    def event_class(self) -> type:
+        if self._event_class is None:
+            self._event_class = getattr(sys.modules["aminoed"], "Event")
+        return self._event_class
+    
+    def dispatch(self, recieved_data: Dict) -> None:
+        if (handler := self.handlers.get(recieved_data["t"])) is not None:
+            handler(recieved_data)
+        
+        self.emit(EventTypes.ANY, recieved_data)
+        
+        if recieved_data["o"].get("id") in self.wait_responses:
+            self.wait_responses[recieved_data["o"].get("id")].set_result(recieved_data["o"])
+    
+    def on_message(self, recieved_data: Dict) -> None:
+        try:
+            if self.lazy_events:
+                event = self.event_class.parse_lazy(self.auth, recieved_data["o"], self.client)
+            else:
+                event = self.event_class(self.auth, recieved_data["o"], self.client)
+            
+            self.emit(EventTypes.MESSAGE, event)
+            
+            event_type = f"{event.type}:{event.mediaType}"
+            
+            if event_type in EVENT_TYPES:
+                self.emit(event_type, event)
+                
+            if event_type == EventTypes.TEXT_MESSAGE and event.content:
+                if (command := self.bot_commands.match(event.content.lower())) is not None:
+                    self.emit(command, event)
+                        
+        except Exception as e:
+            print(e)
+    
+    def on_notification(self, recieved_data: Dict) -> None:
+        self.emit(EventTypes.NOTIFICATION, recieved_data["o"])
+    
+    def on_action(self, recieved_data: Dict) -> None:
+        self.emit(EventTypes.ACTION, recieved_data["o"])
+        
+        if recieved_data["o"]["actions"][0] == "Typing":
+            if recieved_data["t"] == 304:
+                self.emit(EventTypes.USER_TYPING_START, recieved_data["o"])
                 
-                if recieved_data["o"].get("id") in self.wait_responses:
-                    self.wait_responses[recieved_data["o"].get("id")].set_result(recieved_data["o"])
+            if recieved_data["t"] == 306:
+                self.emit(EventTypes.USER_TYPING_END, recieved_data["o"])
             
     async def create_connection(self) -> WSConnection:
         for _ in range(3):
@@ -0,0 +1,63 @@
+# Run from the repository root: python -m benchmarks.compact_memory [messages]
+
+import gc
+import sys
+import tracemalloc
+
+from time import perf_counter
+
+from aminoed import Message, compact_messages
+
+from .payloads import message, user_profile
+
+MESSAGES = int(sys.argv[1]) if len(sys.argv) > 1 else 1_000_000
+SAMPLE = 10_000
+AUTHORS = 500
+THREADS = 50
+
+
+def stream(count: int, authors: list, threads: list):
+    # Fresh dicts (and fresh copies of every string) per message, as they
+    # come off the wire, so interning has real duplicates to fold.
+    for index in range(count):
+        author = dict(authors[index % len(authors)])
+        author["uid"] = "".join(author["uid"])
+        yield message(index, "".join(threads[index % len(threads)]), author)
+
+
+def measure(build) -> tuple:
+    gc.collect()
+    tracemalloc.start()
+    start = perf_counter()
+
+    objects = build()
+
+    elapsed = perf_counter() - start
+    gc.collect()
+    size = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+
+    return objects, size, elapsed
+
+
+def main():
+    authors = [user_profile(index) for index in range(AUTHORS)]
+    threads = [message(index)["threadId"] for index in range(THREADS)]
+
+    _, pydantic_size, pydantic_time = measure(
+        lambda: [Message(**data) for data in stream(SAMPLE, authors, threads)])
+    pydantic_size = pydantic_size * MESSAGES // SAMPLE
+    pydantic_time = pydantic_time * MESSAGES / SAMPLE
+
+    compact, compact_size, compact_time = measure(
+        lambda: compact_messages(stream(MESSAGES, authors, threads)))
+
+    print(f"{MESSAGES:,} messages, {AUTHORS} authors, {THREADS} threads")
+    print(f"pydantic {pydantic_size / 2 ** 20:10,.1f} MiB {pydantic_time:8.1f} s  (extrapolated from {SAMPLE:,})")
+    print(f"compact  {compact_size / 2 ** 20:10,.1f} MiB {compact_time:8.1f} s")
+    print(f"         {pydantic_size / compact_size:10.1f}x less memory, "
+          f"{len({id(item.author) for item in compact})} profile objects")
+
+
+if __name__ == "__main__":
+    main()
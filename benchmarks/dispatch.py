@@ -0,0 +1,101 @@
+# Run from the repository root: python -m benchmarks.dispatch
+
+import sys
+import asyncio
+
+from time import perf_counter
+
+from aminoed import EVENT_TYPES, AminoWebSocket, Auth, EventTypes, allTypes, generate_device
+
+FRAMES = 50000
+REPEAT = 5
+
+
+def frames():
+    message = {
+        "ndcId": 1,
+        "alertOption": 1,
+        "membershipStatus": 1,
+        "chatMessage": {
+            "threadId": "00000000-0000-0000-0000-000000000000",
+            "messageId": "11111111-1111-1111-1111-111111111111",
+            "content": "hello",
+            "type": 0,
+            "mediaType": 0,
+            "author": {"uid": "22222222-2222-2222-2222-222222222222", "nickname": "user"}
+        }
+    }
+
+    return [
+        {"t": 1000, "o": message},
+        {"t": 10, "o": {"payload": {}}},
+        {"t": 304, "o": {"actions": ["Typing"]}},
+        {"t": 306, "o": {"actions": ["Browsing"]}}
+    ]
+
+
+def legacy_dispatch(self: AminoWebSocket, recieved_data):
+    if recieved_data["t"] == 1000:
+        try:
+            context = getattr(sys.modules["aminoed"], "Event")
+
+            event = context(self.auth, recieved_data["o"])
+            self.emitter.emit(EventTypes.MESSAGE, event)
+
+            event_type = f"{event.type}:{event.mediaType}"
+
+            if event_type in allTypes(EventTypes):
+                self.emitter.emit(event_type, event)
+
+        except Exception as e:
+            print(e)
+
+    elif recieved_data["t"] == 10:
+        self.emitter.emit(EventTypes.NOTIFICATION, recieved_data["o"])
+
+    elif recieved_data["t"] == 306 or recieved_data["t"] == 304:
+        self.emitter.emit(EventTypes.ACTION, recieved_data["o"])
+
+        if recieved_data["o"]["actions"][0] == "Typing":
+            if recieved_data["t"] == 304:
+                self.emitter.emit(EventTypes.USER_TYPING_START, recieved_data["o"])
+
+            if recieved_data["t"] == 306:
+                self.emitter.emit(EventTypes.USER_TYPING_END, recieved_data["o"])
+
+    self.emitter.emit(EventTypes.ANY, recieved_data)
+
+    if recieved_data["o"].get("id") in self.wait_responses:
+        self.wait_responses[recieved_data["o"].get("id")].set_result(recieved_data["o"])
+
+
+def bench(name, dispatch, data):
+    best = float("inf")
+
+    for _ in range(REPEAT):
+        start = perf_counter()
+
+        for index in range(FRAMES):
+            dispatch(data[index % len(data)])
+
+        best = min(best, perf_counter() - start)
+
+    print(f"{name:<8} {FRAMES / best:>12,.0f} frames/s")
+
+
+async def main():
+    websocket = AminoWebSocket(Auth(sid="sid", deviceId=generate_device()))
+    data = frames()
+
+    print("full frame dispatch")
+    bench("before", lambda frame: legacy_dispatch(websocket, frame), data)
+    bench("after", websocket.dispatch, data)
+
+    print("event type routing")
+    keys = ["0:0", "0:100", "3:113", "101:0", "999:0"]
+    bench("before", lambda key: key in allTypes(EventTypes), keys)
+    bench("after", lambda key: key in EVENT_TYPES, keys)
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
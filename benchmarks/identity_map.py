@@ -0,0 +1,62 @@
+# Run from the repository root: python -m benchmarks.identity_map
+
+import gc
+import tracemalloc
+
+from time import perf_counter
+
+from aminoed import Blog, HttpClient, IdentityMap, Message, UserProfile
+
+from .payloads import blog, message, user_profile
+
+PAGES = 100
+PAGE_SIZE = 100
+AUTHORS = 200
+
+
+def crawl(client: HttpClient, pages: list) -> list:
+    return [client.parse_list(model, page) for model, page in pages]
+
+
+def measure(client: HttpClient, pages: list) -> tuple:
+    gc.collect()
+    tracemalloc.start()
+    start = perf_counter()
+
+    result = crawl(client, pages)
+
+    elapsed = perf_counter() - start
+    gc.collect()
+    size = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+
+    del result
+    return size, elapsed
+
+
+def main():
+    authors = [user_profile(index) for index in range(AUTHORS)]
+    pages = []
+
+    # Messages, blogs and member lists written by the same few authors.
+    for index in range(PAGES):
+        author = lambda item: authors[(index * PAGE_SIZE + item) % AUTHORS]
+
+        pages.append((Message, [message(item, None, author(item)) for item in range(PAGE_SIZE)]))
+        pages.append((Blog, [{**blog(item), "author": author(item)} for item in range(PAGE_SIZE)]))
+        pages.append((UserProfile, [author(item) for item in range(PAGE_SIZE)]))
+
+    client = HttpClient()
+    plain_size, plain_time = measure(client, pages)
+
+    client.identity_map = IdentityMap()
+    shared_size, shared_time = measure(client, pages)
+
+    print(f"{PAGES * PAGE_SIZE * 3:,} objects, {AUTHORS} authors")
+    print(f"plain     {plain_size / 2 ** 20:8.1f} MiB {plain_time:8.3f} s")
+    print(f"identity  {shared_size / 2 ** 20:8.1f} MiB {shared_time:8.3f} s  "
+          f"({client.identity_map.hits:,} hits, {client.identity_map.misses:,} misses)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,51 @@
+# Run from the repository root: python -m benchmarks.import_time
+
+import subprocess
+import sys
+
+REPEAT = 10
+
+CASES = {
+    "import aminoed": "import aminoed",
+    "+ generate_device": "import aminoed; aminoed.generate_device()",
+    "+ Client": "import aminoed; aminoed.Client",
+    "from aminoed import *": "from aminoed import *"
+}
+
+SIDE_EFFECTS = """
+import signal, sys, aminoed
+print(signal.getsignal(signal.SIGTERM) is signal.SIG_DFL,
+      "loop" not in vars(aminoed),
+      "aminoed.helpers.models" not in sys.modules,
+      "aiohttp" not in sys.modules)
+"""
+
+
+def cold_start(code: str) -> float:
+    # Cumulative microseconds of the top-level import, from -X importtime.
+    best = float("inf")
+
+    for _ in range(REPEAT):
+        result = subprocess.run([sys.executable, "-X", "importtime", "-c", code],
+                                capture_output=True, text=True, check=True)
+        total = sum(int(line.split("|")[1]) for line in result.stderr.splitlines()
+                    if line.startswith("import time:") and not line.split("|")[2].startswith("  ")
+                    and line.split("|")[1].strip().isdigit())
+        best = min(best, total)
+
+    return best / 1000
+
+
+def main():
+    # Interpreter startup (site, encodings) is subtracted from every case.
+    baseline = cold_start("pass")
+
+    for name, code in CASES.items():
+        print(f"{name:<24} {cold_start(code) - baseline:8.1f} ms")
+
+    result = subprocess.run([sys.executable, "-c", SIDE_EFFECTS], capture_output=True, text=True, check=True)
+    print("no SIGTERM handler, no loop, no models, no aiohttp:", result.stdout.strip())
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,50 @@
+# Run from the repository root: python -m benchmarks.lazy_models
+
+from time import perf_counter
+
+from aminoed import Auth, Event, HttpClient, Thread, UserProfile
+
+from .payloads import message, thread, user_profile
+
+REPEAT = 50
+PAGE_SIZE = 100
+
+
+def bench(callback) -> float:
+    start = perf_counter()
+
+    for _ in range(REPEAT):
+        callback()
+
+    return (perf_counter() - start) / REPEAT * 1000
+
+
+def main():
+    client = HttpClient()
+
+    for model, factory, field in ((UserProfile, user_profile, "uid"), (Thread, thread, "title")):
+        page = [factory(index) for index in range(PAGE_SIZE)]
+
+        def read():
+            for item in client.parse_list(model, page):
+                getattr(item, field)
+
+        client.lazy = False
+        eager = bench(read)
+
+        client.lazy = True
+        lazy = bench(read)
+
+        print(f"{model.__name__:<12} eager {eager:8.3f} ms/page  lazy {lazy:8.3f} ms/page")
+
+    auth = Auth(sid="sid")
+    frames = [{"ndcId": 1, "chatMessage": message(index)} for index in range(PAGE_SIZE)]
+
+    eager = bench(lambda: [Event(auth, frame).content for frame in frames])
+    lazy = bench(lambda: [Event.parse_lazy(auth, frame).content for frame in frames])
+
+    print(f"{'Event':<12} eager {eager:8.3f} ms/100  lazy {lazy:8.3f} ms/100")
+
+
+if __name__ == "__main__":
+    main()
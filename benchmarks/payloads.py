@@ -0,0 +1,113 @@
+from uuid import uuid4
+
+
+def user_profile(index: int = 0, ndc_id: int = 1) -> dict:
+    return {
+        "uid": str(uuid4()),
+        "nickname": f"user {index}",
+        "icon": "http://pm1.narvii.com/7000/icon.jpg",
+        "status": 0,
+        "level": 10,
+        "reputation": 1000,
+        "role": 0,
+        "ndcId": ndc_id,
+        "isGlobal": False,
+        "membershipStatus": 0,
+        "onlineStatus": 1,
+        "followingStatus": 0,
+        "accountMembershipStatus": 0,
+        "createdTime": "2022-01-01T00:00:00Z",
+        "modifiedTime": "2023-01-01T00:00:00Z",
+        "content": "about me " * 10,
+        "extensions": {
+            "style": {"backgroundColor": "#ffffff", "backgroundMediaList": [[100, "http://pm1.narvii.com/bg.jpg", None]]},
+            "customTitles": [{"color": "#ff0000", "title": "title"}, {"color": "#00ff00", "title": "other"}],
+            "defaultBubbleId": str(uuid4()),
+            "hideUserProfile": False
+        },
+        "avatarFrame": {
+            "frameId": str(uuid4()),
+            "frameUrl": "http://pm1.narvii.com/frame.zip",
+            "icon": "http://pm1.narvii.com/frame.png",
+            "name": "frame",
+            "version": 1,
+            "frameType": 0,
+            "status": 0,
+            "config": {"name": "frame", "version": 1, "id": "1", "avatarFramePath": "frame.png"},
+            "ownershipInfo": {"isAutoRenew": False, "ownershipStatus": 1}
+        },
+        "settings": {"onlineStatus": 1},
+        "influencerInfo": {"fansCount": 10, "monthlyFee": 5, "pinned": False}
+    }
+
+
+def thread(index: int = 0, ndc_id: int = 1) -> dict:
+    return {
+        "threadId": str(uuid4()),
+        "uid": str(uuid4()),
+        "title": f"chat {index}",
+        "content": "chat description " * 5,
+        "icon": "http://pm1.narvii.com/chat.jpg",
+        "type": 2,
+        "status": 0,
+        "membersCount": 100,
+        "membersQuota": 1000,
+        "ndcId": ndc_id,
+        "createdTime": "2022-01-01T00:00:00Z",
+        "modifiedTime": "2023-01-01T00:00:00Z",
+        "latestActivityTime": "2023-01-01T00:00:00Z",
+        "author": user_profile(index, ndc_id),
+        "membersSummary": [
+            {"uid": str(uuid4()), "nickname": f"member {member}", "icon": "http://pm1.narvii.com/icon.jpg",
+             "status": 0, "role": 0, "membershipStatus": 1}
+            for member in range(5)
+        ],
+        "lastMessageSummary": {"uid": str(uuid4()), "type": 0, "mediaType": 0, "content": "hi",
+                               "messageId": str(uuid4()), "createdTime": "2023-01-01T00:00:00Z"},
+        "extensions": {
+            "viewOnly": False,
+            "coHost": [str(uuid4()) for _ in range(3)],
+            "language": "en",
+            "membersCanInvite": True,
+            "uid": str(uuid4()),
+            "announcement": "announcement",
+            "pinAnnouncement": False,
+            "vvChatJoinType": 1
+        }
+    }
+
+
+def blog(index: int = 0, ndc_id: int = 1) -> dict:
+    return {
+        "blogId": str(uuid4()),
+        "title": f"blog {index}",
+        "content": "blog content " * 50,
+        "type": 0,
+        "status": 0,
+        "votesCount": 10,
+        "commentsCount": 5,
+        "viewCount": 100,
+        "ndcId": ndc_id,
+        "createdTime": "2022-01-01T00:00:00Z",
+        "modifiedTime": "2023-01-01T00:00:00Z",
+        "mediaList": [[100, "http://pm1.narvii.com/image.jpg", None]],
+        "author": user_profile(index, ndc_id),
+        "extensions": {"style": {"backgroundMediaList": []}, "fansOnly": False}
+    }
+
+
+def message(index: int = 0, thread_id: str = None, author: dict = None) -> dict:
+    return {
+        "messageId": str(uuid4()),
+        "threadId": thread_id or str(uuid4()),
+        "uid": (author or {}).get("uid") or str(uuid4()),
+        "content": f"message {index}",
+        "type": 0,
+        "mediaType": 0,
+        "clientRefId": index,
+        "createdTime": "2023-01-01T00:00:00Z",
+        "isHidden": False,
+        "includedInSummary": True,
+        "author": author or user_profile(index),
+        "extensions": {}
+    }
@@ -0,0 +1,38 @@
+# Run from the repository root: python -m benchmarks.raw_parse
+
+from time import perf_counter
+
+from aminoed import Blog, HttpClient, Thread, UserProfile
+
+from .payloads import blog, thread, user_profile
+
+PAGES = 50
+PAGE_SIZE = 100
+
+
+def bench(client: HttpClient, model, page) -> float:
+    start = perf_counter()
+
+    for _ in range(PAGES):
+        client.parse_list(model, page)
+
+    return (perf_counter() - start) / PAGES * 1000
+
+
+def main():
+    client = HttpClient()
+
+    for model, factory in ((UserProfile, user_profile), (Thread, thread), (Blog, blog)):
+        page = [factory(index) for index in range(PAGE_SIZE)]
+
+        client.raw = False
+        parsed = bench(client, model, page)
+
+        client.raw = True
+        raw = bench(client, model, page)
+
+        print(f"{model.__name__:<12} models {parsed:8.3f} ms/page  raw {raw:8.3f} ms/page")
+
+
+if __name__ == "__main__":
+    main()
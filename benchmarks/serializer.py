@@ -0,0 +1,45 @@
+# Run from the repository root: python -m benchmarks.serializer
+
+import json
+
+from time import perf_counter
+
+from aminoed.helpers.serializer import SERIALIZERS
+
+from .payloads import blog, message, thread, user_profile
+
+REPEAT = 2000
+
+
+def bench(callback) -> float:
+    start = perf_counter()
+
+    for _ in range(REPEAT):
+        callback()
+
+    return (perf_counter() - start) / REPEAT * 1000000
+
+
+def main():
+    payloads = {
+        "message": {"o": {"ndcId": 1, "chatMessage": message()}, "t": 1000},
+        "profile": {"userProfile": user_profile()},
+        "threads": {"threadList": [thread(index) for index in range(25)]},
+        "blogs": {"blogList": [blog(index) for index in range(25)]}
+    }
+
+    backends = {"json (old)": (lambda obj: json.dumps(obj).encode(), json.loads), **{
+        name: (serializer.dumps, serializer.loads) for name, serializer in SERIALIZERS.items()}}
+
+    for name, payload in payloads.items():
+        encoded = json.dumps(payload)
+        print(f"{name} ({len(encoded):,} bytes)")
+
+        for backend, (dumps, loads) in backends.items():
+            encode = bench(lambda: dumps(payload))
+            decode = bench(lambda: loads(encoded))
+            print(f"  {backend:<12} encode {encode:9.1f} us  decode {decode:9.1f} us")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,56 @@
+# Run from the repository root: python -m benchmarks.signing
+
+import hmac
+import os
+
+from base64 import b64encode
+from hashlib import sha1
+from time import perf_counter
+
+from aminoed.helpers.utils import (DEVICE_KEY, PREFIX, SIG_KEY, generate_device,
+                                   generate_devices, generate_signature, generate_signatures)
+from aminoed.helpers.serializer import dumps
+
+from .payloads import message
+
+COUNT = 100000
+
+
+def legacy_signature(data: bytes) -> str:
+    return b64encode(PREFIX + hmac.new(SIG_KEY, data, sha1).digest()).decode("utf-8")
+
+
+def legacy_device(data: bytes = None) -> str:
+    identifier = data or os.urandom(20)
+    mac = hmac.new(DEVICE_KEY, PREFIX + identifier, sha1)
+    return f"{PREFIX.hex()}{identifier.hex()}{mac.hexdigest()}".upper()
+
+
+def bench(name: str, callback) -> None:
+    start = perf_counter()
+    callback()
+    elapsed = perf_counter() - start
+    print(f"{name:<24} {COUNT / elapsed:>12,.0f} /s")
+
+
+def main():
+    bodies = [dumps({"content": f"message {index}", "type": 0, "clientRefId": index}) for index in range(COUNT)]
+    large = dumps(message())
+
+    assert generate_signatures(bodies[:10]) == [legacy_signature(body) for body in bodies[:10]]
+    assert generate_device(bytes(20)) == legacy_device(bytes(20))
+
+    bench("signature (before)", lambda: [legacy_signature(body) for body in bodies])
+    bench("signature (after)", lambda: [generate_signature(body) for body in bodies])
+    bench("signatures (batch)", lambda: generate_signatures(bodies))
+
+    bench(f"signature {len(large)}B (before)", lambda: [legacy_signature(large) for _ in range(COUNT)])
+    bench(f"signature {len(large)}B (after)", lambda: [generate_signature(large) for _ in range(COUNT)])
+
+    bench("device (before)", lambda: [legacy_device() for _ in range(COUNT)])
+    bench("device (after)", lambda: [generate_device() for _ in range(COUNT)])
+    bench("devices (batch)", lambda: generate_devices(COUNT))
+
+
+if __name__ == "__main__":
+    main()
@@ -40,13 +40,14 @@ setup(
     ],
     install_requires=[
         "setuptools",
-        "requests",
         "aiohttp",
         "pydantic",
         "aiofile",
-        "eventemitter",
-        "json_minify"
+        "eventemitter"
     ],
+    extras_require={
+        "speedups": ["orjson"]
+    },
     setup_requires=[
         "wheel"
     ],